@@ -1961,10 +1961,9 @@ class Soundboard(BaseCog):
 
             # Reset member stats (guild-specific)
             if stat_type_lower in ["members", "all"]:
-                from bot.core.stats.user_triggers import load_user_stats, save_user_stats, reset_user_stats, USER_STATS_FILE
-                user_stats = load_user_stats(USER_STATS_FILE)
-                count = reset_user_stats(user_stats, period_lower, guild_id=str(ctx.guild.id))
-                save_user_stats(USER_STATS_FILE, user_stats)
+                # Through the stats writer, so it can't race a background flush
+                from bot.core.stats.user_triggers import init_stats_writer
+                count = await init_stats_writer(self.bot).reset(period_lower, guild_id=str(ctx.guild.id))
                 results.append(f"member(s): {count}")
                 logger.info(f"[{ctx.guild.name}] {ctx.author} reset {period_lower} member stats")
 
@@ -2,9 +2,7 @@
 import discord
 from discord.ext import commands
 from discord import FFmpegPCMAudio
-import pyttsx3
 import asyncio
-import tempfile
 import os
 import re
 import json
@@ -12,6 +10,7 @@ from dataclasses import dataclass
 from pathlib import Path
 from bot.base_cog import BaseCog, logger
 from bot.core.errors import UserFeedback
+from bot.core.tts_engines.cache import cleanup_stale_temp_files
 from bot.core.config_base import ConfigBase, config_field
 
 # Preferences file
@@ -113,6 +112,9 @@ class TtsCog(BaseCog):
         self.user_preferences = {}
         self.load_preferences()
 
+        # Scratch audio left over from an interrupted run
+        cleanup_stale_temp_files()
+
     async def get_engine(self, guild_id: int):
         """Get or create TTS engine for this guild based on config."""
         from bot.core.tts_engines import create_tts_engine
@@ -529,6 +531,8 @@ class TtsCog(BaseCog):
                 except Exception as e:
                     logger.error(f"[Guild {guild_id}] Failed to cleanup TTS engine: {e}")
 
+        cleanup_stale_temp_files()
+
 
 async def setup(bot):
     try:
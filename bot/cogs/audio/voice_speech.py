@@ -13,6 +13,7 @@ from bot.core.config_base import ConfigBase, config_field
 from bot.core.audio.sources import DuckedAudioSource
 from bot.core.errors import UserFeedback
 from bot.core.transcript_session import TranscriptSessionManager
+from bot.core.tts_engines.cache import is_tts_cache_file
 from bot.config import config
 
 
@@ -353,9 +354,6 @@ class VoiceSpeechCog(BaseCog):
         # Stop user stats writer (flushes pending updates)
         await self.stats_writer.stop()
 
-        # Stop transcript flush task
-        self.transcript_manager.stop_flush_task()
-
         # Stop keepalive
         if self._keepalive_task and not self._keepalive_task.done():
             self._keepalive_task.cancel()
@@ -411,6 +409,10 @@ class VoiceSpeechCog(BaseCog):
                 except Exception as e:
                     logger.error(f"Error disconnecting from guild {guild.id}: {e}")
 
+        # Stop transcript flush task (after ending sessions, whose final writes are
+        # queued on its writer thread and still complete)
+        self.transcript_manager.stop_flush_task()
+
         self.active_sinks.clear()
         self.sound_queues.clear()
         self.queue_tasks.clear()
@@ -500,7 +502,11 @@ class VoiceSpeechCog(BaseCog):
                 # Add to transcript (skip TTS temp files - they're already logged as [TTS])
                 if vc.channel:
                     # Check if this is a TTS temp file (starts with "tmp" and ends with .wav/.mp3)
-                    is_tts_temp = os.path.basename(soundfile).startswith("tmp") and soundfile.endswith((".wav", ".mp3"))
+                    # or a clip served from the TTS audio cache
+                    is_tts_temp = (
+                        (os.path.basename(soundfile).startswith("tmp") and soundfile.endswith((".wav", ".mp3")))
+                        or is_tts_cache_file(soundfile)
+                    )
 
                     if not is_tts_temp:
                         # Use trigger word if available, otherwise sound name
@@ -6,14 +6,28 @@ implementations (Vosk, Whisper, etc.) without changing voice connection logic.
 """
 
 from .base import SpeechEngine
-from .vosk import VoskEngine
-from .whisper import WhisperEngine
-from .faster_whisper import FasterWhisperEngine
 from .config import SpeechConfig
 import logging
 
 logger = logging.getLogger("discordbot.speech_engines")
 
+# Engine modules import heavy libraries (vosk, whisper/torch, faster-whisper),
+# so they're only imported when an engine is created or accessed
+_LAZY_ENGINES = {
+    "VoskEngine": ".vosk",
+    "WhisperEngine": ".whisper",
+    "FasterWhisperEngine": ".faster_whisper",
+}
+
+
+def __getattr__(name):
+    """Import engine classes on first access (e.g., speech_engines.VoskEngine)."""
+    module_name = _LAZY_ENGINES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    import importlib
+    return getattr(importlib.import_module(module_name, __name__), name)
+
 
 def create_speech_engine(
     bot,
@@ -38,6 +52,8 @@ def create_speech_engine(
     """
 
     if engine_type == "vosk":
+        from .vosk import VoskEngine
+
         # Get Vosk config from bot's ConfigManager
         try:
             speech_cfg = bot.config_manager.for_guild("Speech")
@@ -54,6 +70,8 @@ def create_speech_engine(
         )
 
     elif engine_type == "whisper":
+        from .whisper import WhisperEngine
+
         # Get Whisper config from bot's ConfigManager
         try:
             speech_cfg = bot.config_manager.for_guild("Speech")
@@ -76,6 +94,8 @@ def create_speech_engine(
         )
 
     elif engine_type == "faster-whisper":
+        from .faster_whisper import FasterWhisperEngine
+
         # Get faster-whisper config from bot's ConfigManager
         try:
             speech_cfg = bot.config_manager.for_guild("Speech")
@@ -9,6 +9,7 @@ Implementation based on direct AudioSink usage for full control.
 
 import asyncio
 import json
+import logging
 import discord
 from discord.ext import voice_recv
 import numpy as np
@@ -20,12 +21,32 @@ from concurrent.futures import ThreadPoolExecutor
 from .base import SpeechEngine, logger
 
 try:
-    from vosk import Model, KaldiRecognizer
+    from vosk import Model, KaldiRecognizer, SetLogLevel
     VOSK_AVAILABLE = True
 except ImportError:
     VOSK_AVAILABLE = False
     logger.warning("Vosk not installed. Install with: pip install vosk")
 
+# Python log level -> Vosk log level
+# Vosk: -1=suppress, 0=fatal, 1=error, 2=warning, 3=info, 4=debug
+VOSK_LOG_LEVELS = {
+    "CRITICAL": 0,  # Fatal errors only
+    "ERROR": 1,     # Errors
+    "WARNING": 2,   # Warnings
+    "INFO": -1,     # Suppress (INFO is too verbose for Vosk)
+    "DEBUG": 3      # Show Vosk info when debugging
+}
+
+
+def set_vosk_log_level(level_name: str):
+    """Set the Vosk library's log level to match a Python log level name."""
+    if VOSK_AVAILABLE:
+        SetLogLevel(VOSK_LOG_LEVELS.get(level_name.upper(), -1))
+
+
+# Match the bot's current log level as soon as Vosk is loaded (before any model)
+set_vosk_log_level(logging.getLevelName(logger.getEffectiveLevel()))
+
 
 class VoskSink(voice_recv.AudioSink):
     """
@@ -17,6 +17,7 @@ Example usage:
         )
 """
 
+import sys
 from dataclasses import dataclass, field
 from typing import Any, Callable, Dict, List, Optional, Tuple, Type, Union
 
@@ -72,7 +73,8 @@ def config_field(
     """
     metadata = {
         "description": description,
-        "category": category,
+        # Categories repeat across every field and cog; share one string per name
+        "category": sys.intern(category),
         "guild_override": guild_override,
         "admin_only": admin_only,
         "requires_restart": requires_restart,
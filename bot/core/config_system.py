@@ -17,6 +17,7 @@ import logging
 import ipaddress
 import os
 from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Callable, Dict, List, Optional, Tuple, Type, Union
 
@@ -34,11 +35,36 @@ except ImportError:
 BASE_CONFIG_FILE = Path("data/config/base_config.json")
 GUILDS_CONFIG_DIR = Path("data/config/guilds")
 
-
+# Special case mappings for legacy env var names: (cog_name, key) -> env var
+# (everything else uses COGNAME_KEY)
+ENV_VAR_MAPPINGS: Dict[Tuple[str, str], str] = {
+    ("System", "token"): "DISCORD_TOKEN",
+    ("System", "bot_owner_id"): "BOT_OWNER",
+    ("System", "command_prefix"): "COMMAND_PREFIX",
+    ("System", "max_history"): "MAX_HISTORY",
+    ("System", "log_level"): "LOG_LEVEL",
+    ("System", "enable_web_dashboard"): "ENABLE_WEB_DASHBOARD",
+    ("System", "web_host"): "WEB_HOST",
+    ("System", "web_port"): "WEB_PORT",
+    ("Soundboard", "default_volume"): "DEFAULT_VOLUME",
+    ("Activity", "voice_tracking_enabled"): "VOICE_TRACKING_ENABLED",
+    ("Activity", "voice_points_per_minute"): "VOICE_POINTS_PER_MINUTE",
+    ("Activity", "voice_time_display_mode"): "VOICE_TIME_DISPLAY_MODE",
+    ("Activity", "voice_tracking_type"): "VOICE_TRACKING_TYPE",
+}
+
+# Marks a field with no (valid) environment variable override
+_NO_ENV_OVERRIDE = object()
+
+
+@lru_cache(maxsize=16)
 def validate_ip_address(value: str) -> Tuple[bool, str]:
     """
     Validate IP address format (IPv4 or IPv6).
 
+    Results are cached per value; the same host string is re-validated on
+    every set/reload.
+
     Returns:
         (is_valid, error_message)
     """
@@ -84,6 +110,22 @@ class ConfigField:
     validator: Optional[Callable[[Any], Tuple[bool, str]]] = None
     is_large_int: bool = False
     env_only: bool = False
+    # Valid values resolved from `choices` once at construction (None = no choice constraint);
+    # a frozenset for O(1) membership, or a list if some values are unhashable
+    _valid_values: Optional[Union[frozenset, List[Any]]] = field(default=None, init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        """Resolve choice values once so validate() doesn't rebuild them per call."""
+        if self.choices is not None:
+            # Extract valid values from choices (handles both simple values and tuples)
+            valid_values = [
+                choice[0] if isinstance(choice, (tuple, list)) and len(choice) >= 1 else choice
+                for choice in self.choices
+            ]
+            try:
+                self._valid_values = frozenset(valid_values)
+            except TypeError:
+                self._valid_values = valid_values
 
     def validate(self, value: Any) -> Tuple[bool, Optional[str]]:
         """
@@ -108,16 +150,12 @@ class ConfigField:
             return False, f"Value {value} above maximum {self.max_value}"
 
         # Choice validation
-        if self.choices is not None:
-            # Extract valid values from choices (handles both simple values and tuples)
-            valid_values = []
-            for choice in self.choices:
-                if isinstance(choice, (tuple, list)) and len(choice) >= 1:
-                    valid_values.append(choice[0])  # Extract value from (value, label) tuple
-                else:
-                    valid_values.append(choice)
-
-            if value not in valid_values:
+        if self._valid_values is not None:
+            try:
+                is_choice = value in self._valid_values
+            except TypeError:  # Unhashable value can't be in the frozenset
+                is_choice = False
+            if not is_choice:
                 return False, f"Value {value} not in valid choices: {self.choices}"
 
         # Custom validator
@@ -228,6 +266,8 @@ class ConfigManager:
         self.global_overrides: Dict[str, Dict[str, Any]] = {}  # {cog_name: {key: value}}
         self.guild_overrides: Dict[int, Dict[str, Dict[str, Any]]] = {}  # {guild_id: {cog_name: {key: value}}}
         self._cache: Dict[Tuple[str, str, Optional[int]], Any] = {}  # (cog, key, guild) -> value
+        self._proxies: Dict[Tuple[str, Optional[int]], ConfigProxy] = {}  # (cog, guild) -> proxy
+        self._env_overrides: Dict[Tuple[str, str], Any] = {}  # (cog, key) -> parsed env value
 
         # Load existing configs
         self._load_global_config()
@@ -242,6 +282,7 @@ class ConfigManager:
             schema: CogConfigSchema instance
         """
         self.schemas[cog_name] = schema
+        self._env_overrides = {k: v for k, v in self._env_overrides.items() if k[0] != cog_name}
         logger.info(f"Registered config schema for {cog_name} ({len(schema.fields)} fields)")
 
     def get(self, cog_name: str, key: str, guild_id: Optional[int] = None) -> Any:
@@ -281,23 +322,39 @@ class ConfigManager:
             value = self.global_overrides[cog_name][key]
 
         # Apply environment variable override (if exists)
-        # Special case mappings for legacy env var names
-        env_var_mappings = {
-            ("System", "token"): "DISCORD_TOKEN",
-            ("System", "bot_owner_id"): "BOT_OWNER",
-            ("System", "command_prefix"): "COMMAND_PREFIX",
-            ("System", "max_history"): "MAX_HISTORY",
-            ("System", "log_level"): "LOG_LEVEL",
-            ("System", "enable_web_dashboard"): "ENABLE_WEB_DASHBOARD",
-            ("System", "web_host"): "WEB_HOST",
-            ("System", "web_port"): "WEB_PORT",
-            ("Soundboard", "default_volume"): "DEFAULT_VOLUME",
-            ("Activity", "voice_tracking_enabled"): "VOICE_TRACKING_ENABLED",
-            ("Activity", "voice_points_per_minute"): "VOICE_POINTS_PER_MINUTE",
-            ("Activity", "voice_time_display_mode"): "VOICE_TIME_DISPLAY_MODE",
-            ("Activity", "voice_tracking_type"): "VOICE_TRACKING_TYPE",
-        }
-        env_var_name = env_var_mappings.get((cog_name, key), f"{cog_name.upper()}_{key.upper()}")
+        env_value = self._get_env_override(cog_name, key, field_meta)
+        if env_value is not _NO_ENV_OVERRIDE:
+            value = env_value
+
+        # Apply guild override (if applicable)
+        if guild_id is not None and field_meta.guild_override:
+            if guild_id in self.guild_overrides:
+                if cog_name in self.guild_overrides[guild_id]:
+                    if key in self.guild_overrides[guild_id][cog_name]:
+                        value = self.guild_overrides[guild_id][cog_name][key]
+
+        # Cache the result
+        self._cache[cache_key] = value
+
+        return value
+
+    def _get_env_override(self, cog_name: str, key: str, field_meta: ConfigField) -> Any:
+        """
+        Get the environment variable override for a field, parsed to its type.
+
+        The environment is loaded once at startup (.env), so each variable is
+        read and converted once per field rather than on every cache miss
+        (one per guild); reload() re-reads them.
+
+        Returns:
+            Parsed value, or _NO_ENV_OVERRIDE if the variable is unset or invalid
+        """
+        env_key = (cog_name, key)
+        if env_key in self._env_overrides:
+            return self._env_overrides[env_key]
+
+        value = _NO_ENV_OVERRIDE
+        env_var_name = ENV_VAR_MAPPINGS.get(env_key, f"{cog_name.upper()}_{key.upper()}")
         env_value = os.getenv(env_var_name)
         if env_value is not None:
             # Convert env string to appropriate type
@@ -315,16 +372,7 @@ class ConfigManager:
             except (ValueError, TypeError) as e:
                 logger.warning(f"Failed to parse env var {env_var_name}={env_value}: {e}")
 
-        # Apply guild override (if applicable)
-        if guild_id is not None and field_meta.guild_override:
-            if guild_id in self.guild_overrides:
-                if cog_name in self.guild_overrides[guild_id]:
-                    if key in self.guild_overrides[guild_id][cog_name]:
-                        value = self.guild_overrides[guild_id][cog_name][key]
-
-        # Cache the result
-        self._cache[cache_key] = value
-
+        self._env_overrides[env_key] = value
         return value
 
     def set(self, cog_name: str, key: str, value: Any, guild_id: Optional[int] = None) -> Tuple[bool, Optional[str]]:
@@ -402,9 +450,14 @@ class ConfigManager:
             guild_id: Optional guild ID
 
         Returns:
-            ConfigProxy instance
+            ConfigProxy instance (shared per cog/guild; it reads through the value
+            cache, so it always reflects the latest set/reload)
         """
-        return ConfigProxy(self, cog_name, guild_id)
+        proxy_key = (cog_name, guild_id)
+        proxy = self._proxies.get(proxy_key)
+        if proxy is None:
+            proxy = self._proxies[proxy_key] = ConfigProxy(self, cog_name, guild_id)
+        return proxy
 
     def get_schema(self, cog_name: str) -> Optional[CogConfigSchema]:
         """Get the config schema for a cog."""
@@ -445,6 +498,7 @@ class ConfigManager:
             self._load_global_config()
             self._load_guild_configs()
             self._cache.clear()
+            self._env_overrides.clear()
             logger.info("Reloaded all configurations")
         else:
             # Reload specific guild
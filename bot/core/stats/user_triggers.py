@@ -4,18 +4,53 @@ Tracks how many times users say trigger words, with guild and channel specificit
 Guilds are completely isolated - stats are tracked per guild.
 """
 import json
+import logging
+import os
+import sys
+import heapq
 import asyncio
+import threading
 from dataclasses import dataclass, field, asdict
-from typing import Dict
+from typing import Dict, Optional
 from datetime import datetime
 from pathlib import Path
-from collections import deque
-from bot.base_cog import logger
+from collections import Counter
+from collections.abc import MutableMapping
+from bisect import bisect_right
+from operator import itemgetter
+
+# Same logger as bot.base_cog, without importing the cog machinery (discord, bot config)
+logger = logging.getLogger("discordbot.bot.base_cog")
+
+# Prefer a fast JSON backend when available: orjson, then ujson, then stdlib.
+# All backends exchange UTF-8 bytes so load/save don't care which one is active.
+# The stats file is machine-read only, so it is written compact (no indentation).
+try:
+    import orjson
+
+    _dumps = orjson.dumps
+    _loads = orjson.loads
+    JSON_BACKEND = "orjson"
+except ImportError:
+    try:
+        import ujson
+
+        def _dumps(obj) -> bytes:
+            return ujson.dumps(obj, ensure_ascii=False).encode("utf-8")
+
+        _loads = ujson.loads
+        JSON_BACKEND = "ujson"
+    except ImportError:
+        def _dumps(obj) -> bytes:
+            return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+        _loads = json.loads
+        JSON_BACKEND = "json"
 
 USER_STATS_FILE = "data/stats/user_stats.json"
 
 
-@dataclass
+@dataclass(slots=True)
 class UserTriggerStats:
     """Statistics for a user's trigger word usage within a single guild."""
     week: int = 0
@@ -28,7 +63,7 @@ class UserTriggerStats:
     last_triggered: str = None  # ISO format timestamp
 
 
-@dataclass
+@dataclass(slots=True)
 class UserStats:
     """
     All statistics for a single user within a guild.
@@ -45,47 +80,163 @@ class UserStats:
     trigger_stats: UserTriggerStats = field(default_factory=UserTriggerStats)
 
 
-@dataclass
+class LazyUserMap(MutableMapping):
+    """
+    Dict-like map of user_id -> UserStats that parses users on first access.
+
+    load_user_stats hands each guild its raw ``users`` JSON; an entry is only
+    converted to a UserStats dataclass when something reads it. Commands that
+    touch one guild (or one user) no longer pay to rebuild every user in the
+    file, and untouched entries are written back verbatim on save.
+    """
+
+    def __init__(self, raw_users: Dict[str, dict] = None, guild_id: str = None):
+        # Values are either raw JSON dicts (not yet parsed) or UserStats objects
+        self._entries: Dict[str, object] = dict(raw_users) if raw_users else {}
+        self._guild_id = guild_id
+
+    def __getitem__(self, user_id: str) -> "UserStats":
+        entry = self._entries[user_id]
+        if not isinstance(entry, dict):
+            return entry
+
+        try:
+            user_stat = _parse_user_stats(entry)
+        except Exception as e:
+            logger.error(f"Failed to load stats for user {user_id} in guild {self._guild_id}: {e}")
+            del self._entries[user_id]
+            raise KeyError(user_id) from e
+
+        self._entries[user_id] = user_stat
+        return user_stat
+
+    def __setitem__(self, user_id: str, user_stat: "UserStats"):
+        self._entries[user_id] = user_stat
+
+    def __delitem__(self, user_id: str):
+        del self._entries[user_id]
+
+    def __contains__(self, user_id) -> bool:
+        # Parse (and drop if corrupt) so `uid in users` implies `users[uid]` succeeds
+        try:
+            self[user_id]
+        except KeyError:
+            return False
+        return True
+
+    def __iter__(self):
+        # Snapshot keys so entries that fail to parse can be dropped mid-iteration
+        return iter(list(self._entries))
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def items(self):
+        """Yield (user_id, UserStats) pairs, parsing entries as they are reached."""
+        for user_id in list(self._entries):
+            try:
+                yield user_id, self[user_id]
+            except KeyError:
+                continue
+
+    def values(self):
+        """Yield UserStats objects, parsing entries as they are reached."""
+        for _, user_stat in self.items():
+            yield user_stat
+
+    def raw_items(self):
+        """Yield (user_id, entry) pairs without parsing; entry is a raw dict or UserStats."""
+        return self._entries.items()
+
+
+@dataclass(slots=True)
 class GuildUserStats:
     """Container for all user statistics within a single guild."""
-    users: Dict[str, UserStats] = field(default_factory=dict)  # {user_id: UserStats}
+    users: Dict[str, UserStats] = field(default_factory=LazyUserMap)  # {user_id: UserStats}
+    # Cached result of compute_guild_summary(); cleared whenever counts change
+    _summary: Optional[dict] = field(default=None, init=False, repr=False, compare=False)
 
 
-@dataclass
+@dataclass(slots=True)
 class UserStatsData:
     """Container for all guild statistics. Guilds are completely isolated."""
     guilds: Dict[str, GuildUserStats] = field(default_factory=dict)  # {guild_id: GuildUserStats}
 
 
+def _intern_keys(counts: Dict[str, int]) -> Dict[str, int]:
+    """Rebuild a count dict with interned keys so identical IDs/words share one string."""
+    return {sys.intern(k): v for k, v in counts.items()}
+
+
+def _parse_user_stats(user_data: dict) -> UserStats:
+    """Build a UserStats object from its raw JSON dict."""
+    user_data = dict(user_data)
+
+    # Convert trigger_stats dict to UserTriggerStats object
+    if "trigger_stats" in user_data and isinstance(user_data["trigger_stats"], dict):
+        trigger_stats = dict(user_data["trigger_stats"])
+        # Share one key string per channel/trigger word across all users
+        for key in ("channel_stats", "trigger_words"):
+            if isinstance(trigger_stats.get(key), dict):
+                trigger_stats[key] = _intern_keys(trigger_stats[key])
+        user_data["trigger_stats"] = UserTriggerStats(**trigger_stats)
+
+    return UserStats(**user_data)
+
+
+def _stream_dump(user_stats: UserStatsData, f):
+    """
+    Write user stats to a binary file handle one user at a time.
+
+    Produces the same {"guilds": {id: {"users": {...}}}} document as dumping
+    the whole structure, but only ever encodes a single user's payload, so
+    peak memory stays flat as the file grows. Entries that were never parsed
+    (see LazyUserMap) are written straight from their raw dicts.
+    """
+    f.write(b'{"guilds":{')
+    for guild_index, (guild_id, guild) in enumerate(user_stats.guilds.items()):
+        if guild_index:
+            f.write(b",")
+        f.write(_dumps(guild_id))
+        f.write(b':{"users":{')
+
+        users = guild.users
+        items = users.raw_items() if isinstance(users, LazyUserMap) else users.items()
+        for user_index, (user_id, entry) in enumerate(items):
+            if user_index:
+                f.write(b",")
+            f.write(_dumps(user_id))
+            f.write(b":")
+            f.write(_dumps(entry if isinstance(entry, dict) else asdict(entry)))
+
+        f.write(b"}}")
+    f.write(b"}}")
+
+
 def load_user_stats(file_path: str = USER_STATS_FILE) -> UserStatsData:
-    """Load user stats from JSON file."""
-    logger.info(f"Loading user stats from '{file_path}'...")
+    """
+    Load user stats from JSON file.
+
+    User entries are parsed lazily (see LazyUserMap), so this only decodes
+    the JSON and wraps each guild's raw users.
+    """
+    logger.info(f"Loading user stats from '{file_path}' (backend={JSON_BACKEND})...")
 
     try:
         if not Path(file_path).exists():
             logger.info(f"User stats file not found, creating new one: {file_path}")
             return UserStatsData()
 
-        with open(file_path, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        with open(file_path, "rb") as f:
+            data = _loads(f.read())
 
         guilds = {}
         total_users = 0
 
         for guild_id, guild_data in data.get("guilds", {}).items():
             try:
-                users = {}
-                for user_id, user_data in guild_data.get("users", {}).items():
-                    try:
-                        # Convert trigger_stats dict to UserTriggerStats object
-                        if "trigger_stats" in user_data and isinstance(user_data["trigger_stats"], dict):
-                            user_data["trigger_stats"] = UserTriggerStats(**user_data["trigger_stats"])
-
-                        users[user_id] = UserStats(**user_data)
-                        total_users += 1
-                    except Exception as e:
-                        logger.error(f"Failed to load stats for user {user_id} in guild {guild_id}: {e}")
-
+                users = LazyUserMap(guild_data.get("users", {}), guild_id=guild_id)
+                total_users += len(users)
                 guilds[guild_id] = GuildUserStats(users=users)
             except Exception as e:
                 logger.error(f"Failed to load stats for guild {guild_id}: {e}")
@@ -98,8 +249,19 @@ def load_user_stats(file_path: str = USER_STATS_FILE) -> UserStatsData:
         raise
 
 
-def save_user_stats(file_path: str, user_stats: UserStatsData):
-    """Save user stats to JSON file."""
+def save_user_stats(file_path: str, user_stats: UserStatsData, fsync: bool = False):
+    """
+    Save user stats to JSON file.
+
+    The file is written to a temporary sibling and swapped in with os.replace,
+    so readers never see a half-written file.
+
+    Args:
+        file_path: Path to user stats JSON file
+        user_stats: UserStatsData object
+        fsync: Force the data to disk before replacing (used on shutdown; periodic
+            saves leave it to the OS page cache to avoid a disk barrier per flush)
+    """
     logger.debug(f"Saving user stats to '{file_path}'...")
 
     try:
@@ -116,10 +278,19 @@ def save_user_stats(file_path: str, user_stats: UserStatsData):
                 # If backup fails, log warning but continue with save
                 logger.warning(f"Could not create backup file (continuing anyway): {e}")
 
-        data = {"guilds": {k: asdict(v) for k, v in user_stats.guilds.items()}}
-
-        with open(file_path, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        # Temp name unique to this process and thread, so two saves never share one
+        # (mkstemp would also work, but creates the file 0600 instead of per umask)
+        tmp_path = f"{file_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            with open(tmp_path, "wb") as f:
+                _stream_dump(user_stats, f)
+                if fsync:
+                    f.flush()
+                    os.fsync(f.fileno())
+            os.replace(tmp_path, file_path)
+        except BaseException:
+            Path(tmp_path).unlink(missing_ok=True)
+            raise
 
         total_users = sum(len(guild.users) for guild in user_stats.guilds.values())
         logger.debug(f"Saved stats for {total_users} user(s) across {len(user_stats.guilds)} guild(s)")
@@ -135,7 +306,9 @@ def increment_user_trigger_stat(
     username: str,
     guild_id: str,
     channel_id: str,
-    trigger_word: str = None
+    trigger_word: str = None,
+    timestamp: str = None,
+    count: int = 1
 ) -> UserStatsData:
     """
     Increment trigger stats for a user within a specific guild.
@@ -147,13 +320,15 @@ def increment_user_trigger_stat(
         guild_id: Discord guild ID
         channel_id: Discord channel ID where trigger was used
         trigger_word: Optional trigger word that was used
+        timestamp: Optional ISO timestamp of the trigger (defaults to now)
+        count: Number of triggers to add (for coalesced updates)
 
     Returns:
         Updated UserStatsData object
     """
     user_id_str = str(user_id)
     guild_id_str = str(guild_id)
-    channel_id_str = str(channel_id)
+    channel_id_str = sys.intern(str(channel_id))
 
     # Get or create guild stats
     if guild_id_str not in user_stats.guilds:
@@ -169,30 +344,86 @@ def increment_user_trigger_stat(
         )
 
     user_stat = guild_stats.users[user_id_str]
+    guild_stats._summary = None
 
     # Update username in case it changed
     user_stat.username = username
 
     # Increment counts
-    user_stat.trigger_stats.week += 1
-    user_stat.trigger_stats.month += 1
-    user_stat.trigger_stats.total += 1
+    user_stat.trigger_stats.week += count
+    user_stat.trigger_stats.month += count
+    user_stat.trigger_stats.total += count
 
     # Track channel-specific count within this guild
     user_stat.trigger_stats.channel_stats[channel_id_str] = \
-        user_stat.trigger_stats.channel_stats.get(channel_id_str, 0) + 1
+        user_stat.trigger_stats.channel_stats.get(channel_id_str, 0) + count
 
     # Track trigger word if provided
     if trigger_word:
+        trigger_word = sys.intern(trigger_word)
         user_stat.trigger_stats.trigger_words[trigger_word] = \
-            user_stat.trigger_stats.trigger_words.get(trigger_word, 0) + 1
+            user_stat.trigger_stats.trigger_words.get(trigger_word, 0) + count
 
     # Update timestamp
-    user_stat.trigger_stats.last_triggered = datetime.utcnow().isoformat()
+    user_stat.trigger_stats.last_triggered = timestamp or datetime.utcnow().isoformat()
 
     return user_stats
 
 
+def compute_guild_summary(guild_stats: GuildUserStats) -> dict:
+    """
+    Compute leaderboards, rank tables and recap figures for a guild in one pass.
+
+    The result is cached on the GuildUserStats until the next increment or
+    reset, so a command asking for a leaderboard, ranks and a recap back to
+    back only walks the guild's users once.
+
+    Args:
+        guild_stats: GuildUserStats object
+
+    Returns:
+        Dictionary with summary data:
+        {
+            "leaderboards": {period: [(user_id, username, count), ...]},  # count > 0, descending
+            "sorted_counts": {period: [count, ...]},  # every user's count, ascending
+            "channel_counts": Counter,  # {channel_id: count} across all users
+            "week_total": int,
+            "week_active_users": int
+        }
+    """
+    if guild_stats._summary is not None:
+        return guild_stats._summary
+
+    rows = {"week": [], "month": [], "total": []}
+    channel_counts = Counter()
+
+    for user_id, user_stat in guild_stats.users.items():
+        trigger_stats = user_stat.trigger_stats
+        username = user_stat.username
+        rows["week"].append((user_id, username, trigger_stats.week))
+        rows["month"].append((user_id, username, trigger_stats.month))
+        rows["total"].append((user_id, username, trigger_stats.total))
+        channel_counts.update(trigger_stats.channel_stats)
+
+    leaderboards = {}
+    sorted_counts = {}
+    for period, period_rows in rows.items():
+        # Stable sort keeps file order for ties, matching the old per-call scans
+        leaderboards[period] = sorted(
+            (row for row in period_rows if row[2] > 0), key=itemgetter(2), reverse=True
+        )
+        sorted_counts[period] = sorted(row[2] for row in period_rows)
+
+    guild_stats._summary = {
+        "leaderboards": leaderboards,
+        "sorted_counts": sorted_counts,
+        "channel_counts": channel_counts,
+        "week_total": sum(sorted_counts["week"]),
+        "week_active_users": len(leaderboards["week"])
+    }
+    return guild_stats._summary
+
+
 def reset_user_stats(user_stats: UserStatsData, period: str, guild_id: str = None) -> int:
     """
     Reset user statistics for a given period.
@@ -219,13 +450,20 @@ def reset_user_stats(user_stats: UserStatsData, period: str, guild_id: str = Non
     else:
         guilds_to_reset = user_stats.guilds
 
-    # Reset stats for users in selected guilds
+    # Reset stats for users in selected guilds. Every count drops to zero at once,
+    # so the cached summary is simply discarded rather than updated per user.
     for gid, guild_stats in guilds_to_reset.items():
-        for user_stat in guild_stats.users.values():
-            if period == "week":
-                user_stat.trigger_stats.week = 0
-            elif period == "month":
-                user_stat.trigger_stats.month = 0
+        guild_stats._summary = None
+        users = guild_stats.users
+        entries = users.raw_items() if isinstance(users, LazyUserMap) else users.items()
+        for _, entry in entries:
+            if isinstance(entry, dict):
+                # Not parsed yet - zero the raw JSON instead of building a UserStats
+                trigger_stats = entry.setdefault("trigger_stats", {})
+                if isinstance(trigger_stats, dict):
+                    trigger_stats[period] = 0
+            else:
+                setattr(entry.trigger_stats, period, 0)
             count += 1
 
     logger.info(f"Reset {period} stats for {count} user(s)" + (f" in guild {guild_id}" if guild_id else " across all guilds"))
@@ -262,31 +500,20 @@ def get_leaderboard(
         return []
 
     guild_stats = user_stats.guilds[guild_id_str]
-    leaderboard = []
 
-    for user_id, user_stat in guild_stats.users.items():
-        count = 0
-
-        # Apply filtering based on channel
-        if channel_id:
-            # Channel-specific leaderboard within this guild
-            count = user_stat.trigger_stats.channel_stats.get(str(channel_id), 0)
-        else:
-            # Guild-wide leaderboard
-            if period == "week":
-                count = user_stat.trigger_stats.week
-            elif period == "month":
-                count = user_stat.trigger_stats.month
-            else:  # total
-                count = user_stat.trigger_stats.total
-
-        if count > 0:
-            leaderboard.append((user_id, user_stat.username, count))
+    # Guild-wide leaderboard comes straight from the cached summary
+    if not channel_id:
+        return compute_guild_summary(guild_stats)["leaderboards"][period][:limit]
 
-    # Sort by count descending
-    leaderboard.sort(key=lambda x: x[2], reverse=True)
+    # Channel-specific leaderboard within this guild
+    channel_id_str = str(channel_id)
+    leaderboard = (
+        (user_id, user_stat.username, user_stat.trigger_stats.channel_stats.get(channel_id_str, 0))
+        for user_id, user_stat in guild_stats.users.items()
+    )
 
-    return leaderboard[:limit]
+    # Top `limit` by count descending
+    return heapq.nlargest(limit, (row for row in leaderboard if row[2] > 0), key=itemgetter(2))
 
 
 def get_user_rank(
@@ -331,18 +558,9 @@ def get_user_rank(
     else:  # total
         user_count = user_stat.trigger_stats.total
 
-    # Count how many users have more triggers
-    rank = 1
-    for other_user_stat in guild_stats.users.values():
-        if period == "week":
-            other_count = other_user_stat.trigger_stats.week
-        elif period == "month":
-            other_count = other_user_stat.trigger_stats.month
-        else:  # total
-            other_count = other_user_stat.trigger_stats.total
-
-        if other_count > user_count:
-            rank += 1
+    # Count how many users have more triggers (binary search over the cached counts)
+    sorted_counts = compute_guild_summary(guild_stats)["sorted_counts"][period]
+    rank = 1 + len(sorted_counts) - bisect_right(sorted_counts, user_count)
 
     total_users = len(guild_stats.users)
     return (rank, user_count, total_users)
@@ -380,10 +598,8 @@ def get_user_channel_breakdown(
     user_stat = guild_stats.users[user_id_str]
     channel_stats = user_stat.trigger_stats.channel_stats
 
-    # Sort by count descending
-    sorted_channels = sorted(channel_stats.items(), key=lambda x: x[1], reverse=True)
-
-    return sorted_channels[:limit]
+    # Top `limit` by count descending
+    return heapq.nlargest(limit, channel_stats.items(), key=itemgetter(1))
 
 
 def get_weekly_recap_data(user_stats: UserStatsData, guild_id: str) -> dict:
@@ -417,33 +633,17 @@ def get_weekly_recap_data(user_stats: UserStatsData, guild_id: str) -> dict:
 
     guild_stats = user_stats.guilds[guild_id_str]
 
-    # Find top user of the week
-    top_user = None
-    max_count = 0
-    total_triggers = 0
-    active_users = 0
+    summary = compute_guild_summary(guild_stats)
 
-    for user_id, user_stat in guild_stats.users.items():
-        week_count = user_stat.trigger_stats.week
-        total_triggers += week_count
-
-        if week_count > 0:
-            active_users += 1
-
-        if week_count > max_count:
-            max_count = week_count
-            top_user = (user_id, user_stat.username, week_count)
+    # Top user of the week heads the cached weekly leaderboard
+    week_leaderboard = summary["leaderboards"]["week"]
+    top_user = week_leaderboard[0] if week_leaderboard else None
+    total_triggers = summary["week_total"]
+    active_users = summary["week_active_users"]
 
     # Find most active channel
-    channel_counts = {}
-    for user_stat in guild_stats.users.values():
-        for channel_id, count in user_stat.trigger_stats.channel_stats.items():
-            channel_counts[channel_id] = channel_counts.get(channel_id, 0) + count
-
-    most_active_channel = None
-    if channel_counts:
-        max_channel_id = max(channel_counts, key=channel_counts.get)
-        most_active_channel = (max_channel_id, channel_counts[max_channel_id])
+    most_active = summary["channel_counts"].most_common(1)
+    most_active_channel = most_active[0] if most_active else None
 
     # Calculate average
     avg_per_user = total_triggers / active_users if active_users > 0 else 0.0
@@ -510,10 +710,8 @@ def get_user_top_triggers(
     user_stat = guild_stats.users[user_id_str]
     trigger_words = user_stat.trigger_stats.trigger_words
 
-    # Sort by count descending
-    sorted_triggers = sorted(trigger_words.items(), key=lambda x: x[1], reverse=True)
-
-    return sorted_triggers[:limit]
+    # Top `limit` by count descending
+    return heapq.nlargest(limit, trigger_words.items(), key=itemgetter(1))
 
 
 def render_progress_bar(current: int, target: int, bar_length: int = 10) -> str:
@@ -560,9 +758,19 @@ class UserStatsWriter:
         """
         self.bot = bot
         self.file_path = file_path
-        self.pending_updates = deque()  # Queue of (user_id, username, guild_id, channel_id, trigger_word)
+        # Pending updates coalesced per (user_id, guild_id, channel_id, trigger_word) -> count,
+        # so repeated triggers within one interval collapse into a single entry
+        self._pending_counts: Dict[tuple, int] = {}
+        # Latest (username, timestamp) seen per (guild_id, user_id)
+        self._pending_meta: Dict[tuple, tuple] = {}
         self._write_task = None
         self._stop_flag = False
+        # System config proxy, resolved once; values read through it stay hot-swappable
+        # since ConfigManager invalidates its cache on every set/reload
+        self._sys_cfg = None
+        # Serializes load-modify-save cycles; a shutdown flush can start while a
+        # periodic flush is still running in its worker thread
+        self._file_lock = threading.Lock()
         logger.info(f"UserStatsWriter initialized (file={file_path})")
 
     def queue_update(self, user_id: str, username: str, guild_id: str, channel_id: str, trigger_word: str = None):
@@ -576,12 +784,30 @@ class UserStatsWriter:
             channel_id: Discord channel ID
             trigger_word: Optional trigger word that was used
         """
-        self.pending_updates.append((user_id, username, guild_id, channel_id, trigger_word))
+        # Timestamp at queue time so last_triggered reflects the actual trigger,
+        # not the (possibly much later) flush
+        timestamp = datetime.utcnow().isoformat()
+        # IDs, usernames and trigger words repeat heavily between triggers; intern them
+        # so pending keys reference shared strings instead of fresh copies
+        user_id = sys.intern(str(user_id))
+        guild_id = sys.intern(str(guild_id))
+        key = (
+            user_id,
+            guild_id,
+            sys.intern(str(channel_id)),
+            sys.intern(trigger_word) if trigger_word else trigger_word
+        )
+        self._pending_counts[key] = self._pending_counts.get(key, 0) + 1
+        self._pending_meta[(guild_id, user_id)] = (
+            sys.intern(username) if username else username,
+            timestamp
+        )
 
     def start(self):
         """Start the background write task."""
         if self._write_task is None or self._write_task.done():
             self._stop_flag = False
+            self._sys_cfg = self.bot.config_manager.for_guild("System")
             self._write_task = asyncio.create_task(self._write_loop())
             logger.info("UserStatsWriter background task started")
 
@@ -590,68 +816,105 @@ class UserStatsWriter:
         try:
             while not self._stop_flag:
                 # Read interval from config (hot-swappable)
-                sys_cfg = self.bot.config_manager.for_guild("System")
-                interval = sys_cfg.stats_write_interval
+                interval = self._sys_cfg.stats_write_interval
 
                 await asyncio.sleep(interval)
 
                 # Process all pending updates
-                if self.pending_updates:
+                if self._pending_counts:
                     await self._flush_pending_updates()
 
         except asyncio.CancelledError:
             logger.info("UserStatsWriter background task cancelled")
-            # Flush remaining updates before stopping
-            if self.pending_updates:
-                await self._flush_pending_updates()
+            # Flush remaining updates before stopping, forcing them to disk
+            if self._pending_counts:
+                await self._flush_pending_updates(fsync=True)
             raise
         except Exception as e:
             logger.error(f"Error in UserStatsWriter background task: {e}", exc_info=True)
 
-    async def _flush_pending_updates(self):
-        """Flush all pending updates to disk (runs in thread to avoid blocking event loop)."""
+    async def _flush_pending_updates(self, fsync: bool = False):
+        """
+        Flush all pending updates to disk (runs in thread to avoid blocking event loop).
+
+        Args:
+            fsync: Force the saved file to disk (only needed for the final flush)
+        """
         try:
-            # Get snapshot of pending updates
-            updates_to_process = list(self.pending_updates)
-            self.pending_updates.clear()
+            # Swap out pending updates so new triggers queue into fresh dicts
+            counts, meta = self._pending_counts, self._pending_meta
+            self._pending_counts, self._pending_meta = {}, {}
 
             # Process in background thread to avoid blocking event loop
-            await asyncio.to_thread(self._apply_updates, updates_to_process)
+            await asyncio.to_thread(self._apply_updates, counts, meta, fsync)
 
-            logger.debug(f"Flushed {len(updates_to_process)} user trigger stat update(s)")
+            logger.debug(
+                f"Flushed {sum(counts.values())} user trigger stat update(s) "
+                f"({len(counts)} after coalescing)"
+            )
 
         except Exception as e:
             logger.error(f"Error flushing user trigger stats: {e}", exc_info=True)
 
-    def _apply_updates(self, updates: list):
+    def _apply_updates(self, counts: Dict[tuple, int], meta: Dict[tuple, tuple], fsync: bool = False):
         """
         Apply batched updates to stats file (runs in thread).
 
         Args:
-            updates: List of (user_id, username, guild_id, channel_id, trigger_word) tuples
+            counts: {(user_id, guild_id, channel_id, trigger_word): count}
+            meta: {(guild_id, user_id): (username, timestamp)}
+            fsync: Force the saved file to disk
         """
         try:
-            # Load current stats
-            user_stats = load_user_stats(self.file_path)
-
-            # Apply all updates
-            for user_id, username, guild_id, channel_id, trigger_word in updates:
-                user_stats = increment_user_trigger_stat(
-                    user_stats,
-                    user_id,
-                    username,
-                    guild_id,
-                    channel_id,
-                    trigger_word
-                )
-
-            # Save once
-            save_user_stats(self.file_path, user_stats)
+            with self._file_lock:
+                # Load current stats
+                user_stats = load_user_stats(self.file_path)
+
+                # Apply all updates
+                for (user_id, guild_id, channel_id, trigger_word), count in counts.items():
+                    username, timestamp = meta[(guild_id, user_id)]
+                    user_stats = increment_user_trigger_stat(
+                        user_stats,
+                        user_id,
+                        username,
+                        guild_id,
+                        channel_id,
+                        trigger_word,
+                        timestamp,
+                        count
+                    )
+
+                # Save once
+                save_user_stats(self.file_path, user_stats, fsync=fsync)
 
         except Exception as e:
             logger.error(f"Error applying user trigger stat updates: {e}", exc_info=True)
             raise
 
+    async def reset(self, period: str, guild_id: str = None) -> int:
+        """
+        Reset period stats in the stats file (runs in thread to avoid blocking event loop).
+
+        Goes through the same lock as the background flushes, so a reset and a
+        flush can't interleave their load-modify-save cycles.
+
+        Args:
+            period: "week" or "month"
+            guild_id: Optional guild ID to reset only that guild (None = all guilds)
+
+        Returns:
+            Number of users reset
+        """
+        return await asyncio.to_thread(self._reset_stats, period, guild_id)
+
+    def _reset_stats(self, period: str, guild_id: str = None) -> int:
+        """Load, reset and save the stats file under the file lock (runs in thread)."""
+        with self._file_lock:
+            user_stats = load_user_stats(self.file_path)
+            count = reset_user_stats(user_stats, period, guild_id=guild_id)
+            save_user_stats(self.file_path, user_stats)
+        return count
+
     async def stop(self):
         """Stop the background task and flush remaining updates."""
         self._stop_flag = True
@@ -9,6 +9,9 @@ from dataclasses import dataclass
 from bot.core.config_base import ConfigBase, config_field
 from bot.core.config_system import validate_ip_address
 
+# Valid values for log_level (shared, immutable)
+LOG_LEVEL_CHOICES = ("DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL")
+
 
 @dataclass
 class SystemConfig(ConfigBase):
@@ -54,7 +57,7 @@ class SystemConfig(ConfigBase):
         guild_override=False,
         admin_only=True,
         requires_restart=True,
-        choices=["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"],
+        choices=LOG_LEVEL_CHOICES,
         env_only=True  # Must be in .env to take effect at startup
     )
 
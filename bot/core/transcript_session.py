@@ -5,10 +5,15 @@ Tracks voice channel sessions from first user join to bot disconnect,
 recording all transcriptions for later AI analysis.
 """
 
-import json
-import uuid
+import os
+import sys
+import time
+import secrets
+import itertools
 import asyncio
-from dataclasses import dataclass, field, asdict
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Optional
@@ -16,15 +21,158 @@ import logging
 
 logger = logging.getLogger("discordbot.transcript_session")
 
+# Session index (session_id -> file) kept at the root of the transcripts directory
+SESSION_INDEX_FILE = "_index.json"
 
-@dataclass
+# Active sessions append new records to "<session file>.events.jsonl" on each flush
+# instead of rewriting the whole file; end_session folds them back into the .json
+DELTAS_SUFFIX = ".events.jsonl"
+
+# Delta record key -> session list it extends, in replay order
+_DELTA_LISTS = (
+    ("participant", "participants"),
+    ("participant_event", "participant_events"),
+    ("transcript", "transcript"),
+)
+
+# Flush loop ticks between re-reads of transcript_flush_interval
+FLUSH_INTERVAL_REFRESH_TICKS = 10
+
+# Upper bound on sessions held in memory; past it the least recently active session
+# whose channel the bot has left is ended (saved), so sessions whose end_session()
+# was missed can't accumulate forever
+MAX_ACTIVE_SESSIONS = 100
+
+# Session IDs are opaque (filenames, logs, voice state), so rather than a uuid4 per
+# session use a per-process prefix - start time, pid and a random salt, which keeps
+# IDs unique across restarts - followed by a counter
+_SESSION_ID_PREFIX = f"{int(time.time()):08x}{os.getpid() & 0xffff:04x}{secrets.token_hex(2)}"
+_session_id_counter = itertools.count()
+
+
+def _new_session_id() -> str:
+    """Generate a unique 22-character hex session ID."""
+    return f"{_SESSION_ID_PREFIX}{next(_session_id_counter):06x}"
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# [epoch second, "YYYY-MM-DDTHH:MM:SS"] for the last second _iso_now() formatted
+_iso_second_cache = [None, ""]
+
+
+def _iso_now(now_ns: Optional[int] = None) -> str:
+    """
+    Current UTC time as an ISO 8601 string (like datetime.utcnow().isoformat()).
+
+    Transcripts and participant events are stamped many times per second in
+    busy channels, so the date/time prefix is formatted once per second and
+    only the microseconds are appended per call.
+
+    Args:
+        now_ns: Time to format as time.time_ns() (defaults to now)
+    """
+    second, nanos = divmod(time.time_ns() if now_ns is None else now_ns, 1_000_000_000)
+    if second != _iso_second_cache[0]:
+        _iso_second_cache[0] = second
+        _iso_second_cache[1] = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(second))
+    return f"{_iso_second_cache[1]}.{nanos // 1000:06d}"
+
+
+def _encode_json(data: Dict, indent: bool = True) -> bytes:
+    """
+    Encode data as UTF-8 JSON bytes, using orjson when installed.
+
+    Files are written in binary mode, so there is no text-mode encoding
+    layer between the serializer and the file.
+
+    Args:
+        data: JSON-serializable data
+        indent: Indent by 2 spaces (session files) instead of compact (index)
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 if indent else None)
+
+    import json
+    if indent:
+        return json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def _decode_json(raw: bytes):
+    """Decode UTF-8 JSON bytes, using orjson when installed."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(raw)
+
+    import json
+    return json.loads(raw)
+
+
+def _record_data(record):
+    """A session record for _encode_json(): orjson serializes the dataclass itself."""
+    return record if ORJSON_AVAILABLE else record.to_dict()
+
+
+def _deltas_path(session_file: Path) -> Path:
+    """Path of the append-only delta log belonging to a session file."""
+    return session_file.with_suffix(DELTAS_SUFFIX)
+
+
+def merge_session_deltas(data: Dict, session_file: Path) -> Dict:
+    """
+    Apply a session's delta log (if any) to the data loaded from its file.
+
+    While a session is active its .json file only holds the state as of the
+    last full write; later participants, events and transcript entries are in
+    the .events.jsonl log beside it. Ended sessions are always fully written,
+    so their data is returned as is.
+
+    Args:
+        data: Session data loaded from the .json file (updated in place)
+        session_file: Path of the .json file
+
+    Returns:
+        The session data including every logged record
+    """
+    deltas_path = _deltas_path(session_file)
+    if data.get("end_time") or not deltas_path.exists():
+        return data
+
+    with open(deltas_path, 'rb') as f:
+        for line in f:
+            if not line.strip():
+                continue
+            try:
+                record = _decode_json(line)
+            except ValueError:
+                # Partially written last line (crash mid-flush)
+                logger.warning(f"Skipping unreadable record in {deltas_path}")
+                continue
+            for record_key, list_key in _DELTA_LISTS:
+                if record_key in record:
+                    data.setdefault(list_key, []).append(record[record_key])
+
+    if isinstance(data.get("stats"), dict):
+        data["stats"]["total_messages"] = len(data.get("transcript", []))
+        data["stats"]["unique_speakers"] = len(data.get("participants", []))
+    return data
+
+
+@dataclass(slots=True)
 class Participant:
     """Voice channel participant information (summary - just who was present)."""
     user_id: str
     username: str
 
+    def to_dict(self) -> Dict:
+        """Convert to dictionary for JSON serialization."""
+        return {"user_id": self.user_id, "username": self.username}
+
 
-@dataclass
+@dataclass(slots=True)
 class ParticipantEvent:
     """Single participant join/leave event."""
     timestamp: str
@@ -32,8 +180,17 @@ class ParticipantEvent:
     username: str
     event_type: str  # "join" or "leave"
 
+    def to_dict(self) -> Dict:
+        """Convert to dictionary for JSON serialization."""
+        return {
+            "timestamp": self.timestamp,
+            "user_id": self.user_id,
+            "username": self.username,
+            "event_type": self.event_type
+        }
+
 
-@dataclass
+@dataclass(slots=True)
 class TranscriptEntry:
     """Single transcription entry."""
     timestamp: str
@@ -42,8 +199,26 @@ class TranscriptEntry:
     text: str
     confidence: float = 1.0
 
+    def to_dict(self) -> Dict:
+        """Convert to dictionary for JSON serialization."""
+        return {
+            "timestamp": self.timestamp,
+            "user_id": self.user_id,
+            "username": self.username,
+            "text": self.text,
+            "confidence": self.confidence
+        }
 
-@dataclass
+    @classmethod
+    def from_dict(cls, data: Dict) -> "TranscriptEntry":
+        """Rebuild an entry from JSON, sharing speaker strings with other entries."""
+        data = dict(data)
+        data["user_id"] = sys.intern(data["user_id"])
+        data["username"] = sys.intern(data["username"])
+        return cls(**data)
+
+
+@dataclass(slots=True)
 class TranscriptSession:
     """Voice channel session with transcriptions."""
     session_id: str
@@ -58,6 +233,25 @@ class TranscriptSession:
     transcript: List[TranscriptEntry] = field(default_factory=list)
     file_path: Optional[str] = None  # Track where file is saved
     _dirty: bool = field(default=False, repr=False)  # Has unflushed changes
+    # {user_id: Participant} index over `participants` for O(1) join/leave lookups
+    _participant_index: Dict[str, Participant] = field(default_factory=dict, repr=False)
+    # Memoized duration once end_time is known (see end_session / stats)
+    _duration_seconds: Optional[int] = field(default=None, repr=False)
+    # Epoch seconds behind start_time/end_time when this process set them, so
+    # the duration is a subtraction rather than two ISO parses
+    _start_epoch: Optional[float] = field(default=None, repr=False)
+    _end_epoch: Optional[float] = field(default=None, repr=False)
+    # "YYYYMMDD_HHMMSS" of start_time for the session filename, set by start_session
+    _filename_prefix: Optional[str] = field(default=None, repr=False)
+    # How many participants/events/entries are already on disk (.json + delta log)
+    _persisted_participants: int = field(default=0, repr=False)
+    _persisted_events: int = field(default=0, repr=False)
+    _persisted_transcript: int = field(default=0, repr=False)
+
+    def __post_init__(self):
+        """Index participants passed in at construction (new or loaded sessions)."""
+        for participant in self.participants:
+            self._participant_index.setdefault(participant.user_id, participant)
 
     @property
     def stats(self) -> Dict:
@@ -69,24 +263,76 @@ class TranscriptSession:
                 "unique_speakers": len(self.participants)
             }
 
-        start = datetime.fromisoformat(self.start_time)
-        end = datetime.fromisoformat(self.end_time)
-        duration = (end - start).total_seconds()
+        if self._duration_seconds is None:
+            self._duration_seconds = self._compute_duration()
 
         return {
             "total_messages": len(self.transcript),
-            "duration_seconds": int(duration),
+            "duration_seconds": self._duration_seconds,
             "unique_speakers": len(self.participants)
         }
 
+    def _compute_duration(self) -> int:
+        """Session length in whole seconds (requires end_time)."""
+        if self._start_epoch is not None and self._end_epoch is not None:
+            return int(self._end_epoch - self._start_epoch)
+
+        # Loaded from disk - only the ISO strings are known
+        start = datetime.fromisoformat(self.start_time)
+        end = datetime.fromisoformat(self.end_time)
+        return int((end - start).total_seconds())
+
+    def _mark_persisted(self):
+        """Record that everything currently in the session is on disk."""
+        self._persisted_participants = len(self.participants)
+        self._persisted_events = len(self.participant_events)
+        self._persisted_transcript = len(self.transcript)
+
     def to_dict(self) -> Dict:
-        """Convert session to dictionary for JSON serialization."""
-        data = asdict(self)
-        # Remove internal fields
-        data.pop('_dirty', None)
-        # Add computed stats
-        data['stats'] = self.stats
-        return data
+        """
+        Convert session to dictionary for JSON serialization.
+
+        Built field by field rather than with asdict(), which deep-copies every
+        transcript entry through dataclass introspection; internal fields are
+        left out.
+        """
+        return self._build_dict(records_as_dicts=True)
+
+    def _json_data(self) -> Dict:
+        """
+        Session data for _encode_json().
+
+        orjson serializes the record dataclasses natively (in C, same keys and
+        order as their to_dict()), so with orjson the record lists are passed
+        through as is instead of building a dict per entry.
+        """
+        return self._build_dict(records_as_dicts=not ORJSON_AVAILABLE)
+
+    def _build_dict(self, records_as_dicts: bool) -> Dict:
+        """Top-level session dict; records as dicts or as the dataclasses themselves."""
+        if records_as_dicts:
+            participants = [p.to_dict() for p in self.participants]
+            participant_events = [pe.to_dict() for pe in self.participant_events]
+            transcript = [t.to_dict() for t in self.transcript]
+        else:
+            participants = self.participants
+            participant_events = self.participant_events
+            transcript = self.transcript
+
+        return {
+            "session_id": self.session_id,
+            "guild_id": self.guild_id,
+            "guild_name": self.guild_name,
+            "channel_id": self.channel_id,
+            "channel_name": self.channel_name,
+            "start_time": self.start_time,
+            "end_time": self.end_time,
+            "participants": participants,
+            "participant_events": participant_events,
+            "transcript": transcript,
+            "file_path": self.file_path,
+            "stats": self.stats
+        }
 
 
 class TranscriptSessionManager:
@@ -99,31 +345,162 @@ class TranscriptSessionManager:
             bot: Discord bot instance (for accessing ConfigManager)
         """
         self.bot = bot
-        self.active_sessions: Dict[str, TranscriptSession] = {}  # {channel_id: session}
+        # {channel_id: session}, least recently active first
+        self.active_sessions: "OrderedDict[str, TranscriptSession]" = OrderedDict()
         self._flush_task: Optional[asyncio.Task] = None
+        # Single writer thread for flushes, kept off the default executor shared
+        # with other blocking work (created on demand, see _get_io_executor)
+        self._io_executor: Optional[ThreadPoolExecutor] = None
 
         # Get transcript directory from config (will use Voice config)
         # Note: We'll read this dynamically in methods to support hot-reload
+        self._voice_cfg = None  # Voice config proxy, see _get_voice_cfg()
+        self._transcripts_dir: Optional[tuple] = None  # (configured dir, Path)
+
+        # {session_id: path relative to transcripts dir}, loaded lazily from SESSION_INDEX_FILE
+        self._session_index: Optional[Dict[str, str]] = None
+        self._session_index_dir: Optional[Path] = None  # Transcripts dir the index belongs to
+        self._session_index_rebuilt_dir: Optional[Path] = None  # Dir fully scanned this run
 
         logger.info("TranscriptSessionManager initialized")
 
+    def _get_voice_cfg(self):
+        """Voice config proxy (resolved once; it reads through ConfigManager's cache)."""
+        if self._voice_cfg is None:
+            self._voice_cfg = self.bot.config_manager.for_guild("Voice", "System")
+        return self._voice_cfg
+
     def _get_transcripts_dir(self) -> Path:
         """Get transcripts directory from config."""
         try:
-            voice_cfg = self.bot.config_manager.for_guild("Voice", "System")
-            return Path(voice_cfg.transcript_dir)
+            transcript_dir = self._get_voice_cfg().transcript_dir
         except:
             # Fallback to default if config not available
-            return Path("data/transcripts/sessions")
+            transcript_dir = "data/transcripts/sessions"
+
+        # Only build a new Path when the configured directory changes
+        if self._transcripts_dir is None or self._transcripts_dir[0] != transcript_dir:
+            self._transcripts_dir = (transcript_dir, Path(transcript_dir))
+        return self._transcripts_dir[1]
+
+    def _get_session_index(self, base_dir: Path) -> Dict[str, str]:
+        """
+        Get the session_id -> file index for a transcripts directory.
+
+        Loaded from disk on first use (and again if the configured directory
+        changes); a missing or unreadable index just starts empty, since
+        lookups fall back to a directory search.
+        """
+        if self._session_index is None or self._session_index_dir != base_dir:
+            self._session_index = {}
+            self._session_index_dir = base_dir
+            index_path = base_dir / SESSION_INDEX_FILE
+            if index_path.exists():
+                try:
+                    with open(index_path, 'rb') as f:
+                        self._session_index = _decode_json(f.read())
+                except Exception as e:
+                    logger.warning(f"Could not read transcript session index {index_path}: {e}")
+        return self._session_index
+
+    def _index_session(self, base_dir: Path, session_id: str, filepath: Path):
+        """Record a session's file in the index and persist it (atomic write)."""
+        index = self._get_session_index(base_dir)
+        relative_path = filepath.relative_to(base_dir).as_posix()
+        if index.get(session_id) == relative_path:
+            return
+        index[session_id] = relative_path
+        self._write_session_index(base_dir)
+
+    def _write_session_index(self, base_dir: Path):
+        """Persist the in-memory session index for base_dir (atomic write)."""
+        try:
+            index_path = base_dir / SESSION_INDEX_FILE
+            temp_path = index_path.with_suffix('.tmp')
+            with open(temp_path, 'wb') as f:
+                f.write(_encode_json(self._get_session_index(base_dir), indent=False))
+            temp_path.replace(index_path)
+        except Exception as e:
+            logger.warning(f"Could not write transcript session index: {e}")
+
+    def _rebuild_session_index(self, base_dir: Path):
+        """
+        Index every session file under base_dir in one pass.
+
+        Session files live at {guild_id}/{channel_id}/{YYYYMMDD_HHMMSS}_{session_id}.json,
+        so only that depth is scanned. Runs at most once per directory per process.
+        """
+        self._session_index_rebuilt_dir = base_dir
+        index = self._get_session_index(base_dir)
+        added = 0
+        for filepath in base_dir.glob("*/*/*.json"):
+            parts = filepath.stem.split("_", 2)
+            if len(parts) != 3:
+                continue
+            relative_path = filepath.relative_to(base_dir).as_posix()
+            if index.get(parts[2]) != relative_path:
+                index[parts[2]] = relative_path
+                added += 1
+
+        if added:
+            self._write_session_index(base_dir)
+            logger.info(f"Indexed {added} transcript session file(s) in {base_dir}")
+
+    def _find_session_file(
+        self,
+        session_id: str,
+        guild_id: Optional[str] = None,
+        channel_id: Optional[str] = None
+    ) -> Optional[Path]:
+        """
+        Locate a session file via the index.
+
+        Sessions missing from the index (e.g. written before it existed) are
+        looked for in their channel's directory when guild/channel are known,
+        then by re-indexing the whole transcripts directory once.
+
+        Args:
+            session_id: Session ID
+            guild_id: Guild ID the session belongs to, if known
+            channel_id: Channel ID the session belongs to, if known
+
+        Returns:
+            Path to the session file, or None if not found
+        """
+        base_dir = self._get_transcripts_dir()
+
+        relative_path = self._get_session_index(base_dir).get(session_id)
+        if relative_path:
+            filepath = base_dir / relative_path
+            if filepath.exists():
+                return filepath
+
+        if guild_id and channel_id:
+            for filepath in (base_dir / guild_id / channel_id).glob(f"*_{session_id}.json"):
+                self._index_session(base_dir, session_id, filepath)
+                return filepath
+
+        if self._session_index_rebuilt_dir != base_dir:
+            self._rebuild_session_index(base_dir)
+            relative_path = self._session_index.get(session_id)
+            if relative_path and (base_dir / relative_path).exists():
+                return base_dir / relative_path
+
+        return None
 
     def _get_flush_interval(self) -> int:
         """Get flush interval from config."""
         try:
-            voice_cfg = self.bot.config_manager.for_guild("Voice", "System")
-            return voice_cfg.transcript_flush_interval
+            return self._get_voice_cfg().transcript_flush_interval
         except:
             return 30  # Default fallback
 
+    def _get_io_executor(self) -> ThreadPoolExecutor:
+        """Get the transcript writer thread, creating it if needed."""
+        if self._io_executor is None:
+            self._io_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="transcript-io")
+        return self._io_executor
+
     def start_flush_task(self):
         """Start background task to periodically flush active sessions."""
         if self._flush_task is None or self._flush_task.done():
@@ -136,23 +513,33 @@ class TranscriptSessionManager:
             self._flush_task.cancel()
             logger.info("Stopped transcript flush task")
 
+        if self._io_executor is not None:
+            # Writes already submitted still complete; a later start gets a new thread
+            self._io_executor.shutdown(wait=False)
+            self._io_executor = None
+
     async def _flush_loop(self):
         """Background loop that periodically flushes dirty sessions."""
         try:
-            while True:
-                interval = self._get_flush_interval()
+            # The interval rarely changes; re-read it every few ticks, not every tick
+            interval = self._get_flush_interval()
+            for tick in itertools.count(1):
                 await asyncio.sleep(interval)
-
-                # Flush all dirty sessions
-                flushed_count = 0
-                for channel_id, session in self.active_sessions.items():
-                    if session._dirty:
-                        await asyncio.to_thread(self._update_session_file, session)
-                        session._dirty = False
-                        flushed_count += 1
-
-                if flushed_count > 0:
-                    logger.debug(f"Flushed {flushed_count} transcript session(s)")
+                if tick % FLUSH_INTERVAL_REFRESH_TICKS == 0:
+                    interval = self._get_flush_interval()
+
+                # Flush all dirty sessions in one hop to the writer thread. Entries only
+                # accumulate in memory between ticks, so each write covers every
+                # change since the last one. Clear the flags before writing, so
+                # changes made during the write are picked up by the next tick.
+                dirty = [session for session in self.active_sessions.values() if session._dirty]
+                for session in dirty:
+                    session._dirty = False
+                if dirty:
+                    await asyncio.get_running_loop().run_in_executor(
+                        self._get_io_executor(), self._flush_batch, dirty
+                    )
+                    logger.debug(f"Flushed {len(dirty)} transcript session(s)")
 
         except asyncio.CancelledError:
             logger.info("Transcript flush loop cancelled")
@@ -178,27 +565,87 @@ class TranscriptSessionManager:
             session_dir.mkdir(parents=True, exist_ok=True)
 
             # Create filename with timestamp and session ID
-            start_dt = datetime.fromisoformat(session.start_time)
-            filename = f"{start_dt.strftime('%Y%m%d_%H%M%S')}_{session.session_id}.json"
+            prefix = session._filename_prefix
+            if prefix is None:
+                prefix = datetime.fromisoformat(session.start_time).strftime('%Y%m%d_%H%M%S')
+            filename = f"{prefix}_{session.session_id}.json"
             filepath = session_dir / filename
             logger.info(f"Writing to filepath: {filepath}")
 
             # Store filepath in session
             session.file_path = str(filepath)
+            self._index_session(base_dir, session.session_id, filepath)
 
             # Write initial session data
-            with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(session.to_dict(), f, indent=2, ensure_ascii=False)
+            with open(filepath, 'wb') as f:
+                f.write(_encode_json(session._json_data()))
+            session._mark_persisted()
 
             logger.info(f"Created transcript session file: {filepath}")
 
         except Exception as e:
             logger.error(f"Failed to create transcript session file for {session.session_id}: {e}", exc_info=True)
 
+    def _flush_batch(self, sessions: List[TranscriptSession]):
+        """Append deltas for several sessions, sequentially in the calling thread."""
+        for session in sessions:
+            self._append_session_deltas(session)
+
+    def _append_session_deltas(self, session: TranscriptSession):
+        """
+        Append records added since the last flush to the session's delta log.
+
+        Each flush writes only the new participants, events and transcript
+        entries (one JSON object per line) instead of rewriting the whole
+        session, so flush cost doesn't grow with session length.
+
+        Args:
+            session: TranscriptSession to flush
+        """
+        if not session.file_path:
+            logger.warning(f"Cannot update session {session.session_id}: no file_path set")
+            return
+
+        # Snapshot lengths first; the event loop may append while we write
+        participant_count = len(session.participants)
+        event_count = len(session.participant_events)
+        transcript_count = len(session.transcript)
+
+        records = []
+        for p in session.participants[session._persisted_participants:participant_count]:
+            records.append(_encode_json({"participant": _record_data(p)}, indent=False))
+        for pe in session.participant_events[session._persisted_events:event_count]:
+            records.append(_encode_json({"participant_event": _record_data(pe)}, indent=False))
+        for t in session.transcript[session._persisted_transcript:transcript_count]:
+            records.append(_encode_json({"transcript": _record_data(t)}, indent=False))
+
+        if not records:
+            return
+
+        try:
+            deltas_path = _deltas_path(Path(session.file_path))
+            with open(deltas_path, 'ab') as f:
+                f.write(b"\n".join(records) + b"\n")
+
+            session._persisted_participants = participant_count
+            session._persisted_events = event_count
+            session._persisted_transcript = transcript_count
+
+            logger.debug(f"Appended {len(records)} record(s) to {deltas_path}")
+
+        except Exception as e:
+            logger.error(f"Failed to append transcript session deltas for {session.session_id}: {e}", exc_info=True)
+
     def _update_session_file(self, session: TranscriptSession):
         """
-        Update existing session file with new data (incremental write).
-        Uses atomic write (write to temp file, then rename).
+        Rewrite the session file with the complete session data.
+        Uses atomic write (write to temp file, then rename), after which the
+        delta log is no longer needed and is removed.
+
+        This is the session's final write (end_session), so the data is
+        fsynced before the rename; periodic flushes only append to the delta
+        log and leave durability to the OS. Runs on the writer thread only,
+        never on the event loop, since the fsync waits for the disk.
 
         Args:
             session: TranscriptSession to update
@@ -212,11 +659,15 @@ class TranscriptSessionManager:
             temp_filepath = filepath.with_suffix('.tmp')
 
             # Write to temp file
-            with open(temp_filepath, 'w', encoding='utf-8') as f:
-                json.dump(session.to_dict(), f, indent=2, ensure_ascii=False)
+            with open(temp_filepath, 'wb') as f:
+                f.write(_encode_json(session._json_data()))
+                f.flush()
+                os.fsync(f.fileno())
 
             # Atomic replace
             temp_filepath.replace(filepath)
+            session._mark_persisted()
+            _deltas_path(filepath).unlink(missing_ok=True)
 
             logger.debug(f"Updated transcript session file: {filepath}")
 
@@ -246,7 +697,7 @@ class TranscriptSessionManager:
             existing_session_id: Optional session ID to resume (from voice state)
 
         Returns:
-            session_id: UUID of the resumed or created session
+            session_id: ID of the resumed or created session
         """
         # Check if session already active in memory
         if channel_id in self.active_sessions:
@@ -256,13 +707,14 @@ class TranscriptSessionManager:
         # Try to resume existing session from disk
         if existing_session_id:
             try:
-                session = self._load_session_from_disk(existing_session_id)
+                session = self._load_session_from_disk(existing_session_id, guild_id, channel_id)
                 if session:
                     # Add session to active sessions
+                    self._evict_idle_session()
                     self.active_sessions[channel_id] = session
 
                     # Add a resume event
-                    now = datetime.utcnow().isoformat()
+                    now = _iso_now()
                     resume_event = ParticipantEvent(
                         timestamp=now,
                         user_id=first_user_id,
@@ -291,28 +743,34 @@ class TranscriptSessionManager:
             first_username=first_username
         )
 
-    def _load_session_from_disk(self, session_id: str) -> Optional[TranscriptSession]:
+    def _load_session_from_disk(
+        self,
+        session_id: str,
+        guild_id: Optional[str] = None,
+        channel_id: Optional[str] = None
+    ) -> Optional[TranscriptSession]:
         """
         Load a session from disk by session ID.
 
         Args:
-            session_id: Session UUID
+            session_id: Session ID
+            guild_id: Guild ID the session belongs to, if known (narrows the search)
+            channel_id: Channel ID the session belongs to, if known
 
         Returns:
             TranscriptSession or None if not found
         """
         try:
-            base_dir = self._get_transcripts_dir()
-
-            # Search recursively for file containing this session ID
-            for filepath in base_dir.glob(f"**/*_{session_id}.json"):
-                with open(filepath, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
+            filepath = self._find_session_file(session_id, guild_id, channel_id)
+            if filepath:
+                with open(filepath, 'rb') as f:
+                    data = _decode_json(f.read())
+                data = merge_session_deltas(data, filepath)
 
                 # Convert lists back to dataclass instances
                 participants = [Participant(**p) for p in data.get('participants', [])]
                 participant_events = [ParticipantEvent(**pe) for pe in data.get('participant_events', [])]
-                transcript = [TranscriptEntry(**t) for t in data.get('transcript', [])]
+                transcript = [TranscriptEntry.from_dict(t) for t in data.get('transcript', [])]
 
                 session = TranscriptSession(
                     session_id=data['session_id'],
@@ -327,6 +785,7 @@ class TranscriptSessionManager:
                     transcript=transcript,
                     file_path=str(filepath)
                 )
+                session._mark_persisted()
 
                 logger.info(f"Loaded session {session_id} from disk: {filepath}")
                 return session
@@ -359,15 +818,16 @@ class TranscriptSessionManager:
             first_username: Username of first user
 
         Returns:
-            session_id: UUID of the created session
+            session_id: ID of the created session
         """
         # Check if session already exists
         if channel_id in self.active_sessions:
             logger.warning(f"Session already exists for channel {channel_id}")
             return self.active_sessions[channel_id].session_id
 
-        session_id = str(uuid.uuid4())
-        now = datetime.utcnow().isoformat()
+        session_id = _new_session_id()
+        now_ns = time.time_ns()
+        now = _iso_now(now_ns)
 
         first_participant = Participant(
             user_id=first_user_id,
@@ -390,9 +850,12 @@ class TranscriptSessionManager:
             channel_name=channel_name,
             start_time=now,
             participants=[first_participant],
-            participant_events=[first_join_event]
+            participant_events=[first_join_event],
+            _start_epoch=now_ns / 1e9,
+            _filename_prefix=time.strftime("%Y%m%d_%H%M%S", time.gmtime(now_ns // 1_000_000_000))
         )
 
+        self._evict_idle_session()
         self.active_sessions[channel_id] = session
 
         # Create session file immediately
@@ -427,7 +890,7 @@ class TranscriptSessionManager:
             return
 
         session = self.active_sessions[channel_id]
-        now = datetime.utcnow().isoformat()
+        now = _iso_now()
 
         # Add join event to chronological log
         join_event = ParticipantEvent(
@@ -439,13 +902,13 @@ class TranscriptSessionManager:
         session.participant_events.append(join_event)
 
         # Check if participant already exists in summary list
-        participant_exists = any(p.user_id == user_id for p in session.participants)
-        if not participant_exists:
+        if user_id not in session._participant_index:
             participant = Participant(
                 user_id=user_id,
                 username=username
             )
             session.participants.append(participant)
+            session._participant_index[user_id] = participant
 
         # Mark session as dirty for next flush
         session._dirty = True
@@ -467,14 +930,11 @@ class TranscriptSessionManager:
             return
 
         session = self.active_sessions[channel_id]
-        now = datetime.utcnow().isoformat()
+        now = _iso_now()
 
         # Find username from participants list
-        username = "Unknown"
-        for p in session.participants:
-            if p.user_id == user_id:
-                username = p.username
-                break
+        participant = session._participant_index.get(user_id)
+        username = participant.username if participant else "Unknown"
 
         # Add leave event to chronological log
         leave_event = ParticipantEvent(
@@ -513,15 +973,18 @@ class TranscriptSessionManager:
 
         session = self.active_sessions[channel_id]
 
+        # A session has few speakers but many entries; intern speaker strings so
+        # entries share them instead of each holding its own copy
         entry = TranscriptEntry(
-            timestamp=datetime.utcnow().isoformat(),
-            user_id=user_id,
-            username=username,
+            timestamp=_iso_now(),
+            user_id=sys.intern(user_id),
+            username=sys.intern(username),
             text=text,
             confidence=confidence
         )
 
         session.transcript.append(entry)
+        self.active_sessions.move_to_end(channel_id)
 
         # Mark session as dirty for next flush
         session._dirty = True
@@ -554,6 +1017,36 @@ class TranscriptSessionManager:
             confidence=1.0
         )
 
+    def _evict_idle_session(self):
+        """
+        End the least recently active orphaned session if MAX_ACTIVE_SESSIONS are open.
+
+        Only sessions whose channel the bot is no longer connected to are
+        ended; a connected channel may just be quiet (speech that hasn't been
+        transcribed yet doesn't count as activity), so its session is kept.
+        """
+        if len(self.active_sessions) < MAX_ACTIVE_SESSIONS:
+            return
+
+        connected = {
+            str(vc.channel.id) for vc in self.bot.voice_clients if vc.channel
+        }
+        for channel_id in self.active_sessions:
+            if channel_id not in connected:
+                break
+        else:
+            logger.warning(
+                f"{len(self.active_sessions)} transcript sessions active, "
+                f"all in connected channels - not ending any"
+            )
+            return
+
+        logger.warning(
+            f"{len(self.active_sessions)} transcript sessions active, ending "
+            f"least recently active session for disconnected channel {channel_id}"
+        )
+        self.end_session(channel_id)
+
     def end_session(self, channel_id: str) -> Optional[str]:
         """
         End a transcript session and save to file.
@@ -562,25 +1055,30 @@ class TranscriptSessionManager:
             channel_id: Voice channel ID
 
         Returns:
-            session_id: UUID of the ended session, or None if no session exists
+            session_id: ID of the ended session, or None if no session exists
         """
         if channel_id not in self.active_sessions:
             logger.warning(f"No active session to end for channel {channel_id}")
             return None
 
         session = self.active_sessions[channel_id]
-        session.end_time = datetime.utcnow().isoformat()
-
-        # Final flush to ensure all data written
-        self._update_session_file(session)
+        now_ns = time.time_ns()
+        session.end_time = _iso_now(now_ns)
+        session._end_epoch = now_ns / 1e9
+        session._duration_seconds = session._compute_duration()
 
-        # Remove from active sessions
+        # Remove from active sessions so the flush loop no longer picks it up
         del self.active_sessions[channel_id]
 
+        # Final write on the writer thread, queued behind any flush already submitted,
+        # so all writes to a session's files (and its _persisted_* counters) stay there
+        self._get_io_executor().submit(self._update_session_file, session)
+
+        stats = session.stats
         logger.info(
             f"Ended transcript session {session.session_id} - "
-            f"{session.stats['total_messages']} messages, "
-            f"{session.stats['duration_seconds']}s duration"
+            f"{stats['total_messages']} messages, "
+            f"{stats['duration_seconds']}s duration"
         )
 
         return session.session_id
@@ -596,43 +1094,3 @@ class TranscriptSessionManager:
             TranscriptSession or None
         """
         return self.active_sessions.get(channel_id)
-
-
-    def load_session(self, session_id: str) -> Optional[TranscriptSession]:
-        """
-        Load a session from file by ID.
-
-        Args:
-            session_id: Session UUID
-
-        Returns:
-            TranscriptSession or None if not found
-        """
-        try:
-            # Search for file containing this session ID
-            for filepath in TRANSCRIPTS_DIR.glob(f"*_{session_id}.json"):
-                with open(filepath, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-
-                # Convert lists back to dataclass instances
-                participants = [Participant(**p) for p in data['participants']]
-                transcript = [TranscriptEntry(**t) for t in data['transcript']]
-
-                return TranscriptSession(
-                    session_id=data['session_id'],
-                    guild_id=data['guild_id'],
-                    guild_name=data['guild_name'],
-                    channel_id=data['channel_id'],
-                    channel_name=data['channel_name'],
-                    start_time=data['start_time'],
-                    end_time=data.get('end_time'),
-                    participants=participants,
-                    transcript=transcript
-                )
-
-            logger.warning(f"Session {session_id} not found")
-            return None
-
-        except Exception as e:
-            logger.error(f"Failed to load session {session_id}: {e}", exc_info=True)
-            return None
@@ -4,6 +4,7 @@ Base TTS engine interface.
 All TTS engines must inherit from TTSEngine and implement the required methods.
 """
 
+import asyncio
 from abc import ABC, abstractmethod
 from typing import Optional, List, Dict, Any
 import logging
@@ -14,6 +15,9 @@ logger = logging.getLogger("discordbot.tts_engines")
 class TTSEngine(ABC):
     """Base class for TTS engines."""
 
+    # Engine identifier, used in audio cache keys (e.g., "edge")
+    engine_name: str = ""
+
     def __init__(self, bot):
         """
         Initialize TTS engine.
@@ -76,6 +80,97 @@ class TTSEngine(ABC):
         """
         pass
 
+    def cache_key_params(
+        self,
+        voice: Optional[str],
+        rate: Optional[float],
+        volume: float,
+        guild_id: Optional[int]
+    ) -> Dict[str, Any]:
+        """
+        Parameters that determine the generated audio, for the audio cache key.
+
+        Override to drop parameters the engine ignores, so they don't split the cache.
+
+        Args:
+            voice: Requested voice (None = engine default for the guild)
+            rate: Requested rate (None = engine default for the guild)
+            volume: Requested volume
+            guild_id: Guild ID for config access
+
+        Returns:
+            Dictionary of key parameters
+        """
+        params = {"voice": voice or self.get_default_voice(guild_id), "rate": rate, "volume": volume}
+        if rate is None:
+            # Default rate may come from guild config
+            params["guild_id"] = guild_id
+        return params
+
     def cleanup(self):
         """Cleanup resources. Override if needed."""
         pass
+
+
+class CachingTTSMixin:
+    """
+    Serves repeated generate_audio() requests from the shared on-disk audio cache.
+
+    Mixed in ahead of an engine class by create_tts_engine(), so every engine
+    gets caching without its own generate_audio knowing about it. Identical
+    requests made while one is still being synthesized share its result.
+    """
+
+    # {cache key: synthesis task}, shared by all engine instances (one per guild)
+    _inflight: Dict[str, "asyncio.Task[str]"] = {}
+
+    async def generate_audio(
+        self,
+        text: str,
+        voice: Optional[str] = None,
+        rate: Optional[float] = None,
+        volume: float = 1.0,
+        guild_id: Optional[int] = None,
+        **kwargs
+    ) -> str:
+        """Return cached audio for this request, or generate it and cache the result."""
+        from .cache import get_tts_cache, make_cache_key
+
+        cache = get_tts_cache()
+        params = self.cache_key_params(voice, rate, volume, guild_id)
+        params.update(kwargs)
+        cache_key = make_cache_key(self.engine_name, text, **params)
+
+        cached_path = cache.get(cache_key)
+        if cached_path:
+            logger.info(f"[Guild {guild_id}] {self.engine_name} TTS: Using cached audio")
+            return cached_path
+
+        task = self._inflight.get(cache_key)
+        if task is None:
+            task = asyncio.ensure_future(self._synthesize_and_cache(
+                cache, cache_key, text, voice=voice, rate=rate, volume=volume, guild_id=guild_id, **kwargs
+            ))
+            self._inflight[cache_key] = task
+
+            def _finished(t: "asyncio.Task[str]"):
+                # Retrieve any failure, so one with every waiter cancelled isn't
+                # logged as "Task exception was never retrieved"
+                if not t.cancelled():
+                    t.exception()
+                self._inflight.pop(cache_key, None)
+
+            task.add_done_callback(_finished)
+        else:
+            logger.info(f"[Guild {guild_id}] {self.engine_name} TTS: Waiting for identical in-flight request")
+
+        # Shielded so one cancelled caller doesn't abort synthesis for the others
+        return await asyncio.shield(task)
+
+    async def _synthesize_and_cache(self, cache, cache_key: str, text: str, **kwargs) -> str:
+        """Generate audio with the engine, convert it to the playback format and cache it."""
+        from .cache import convert_for_playback
+
+        filepath = await super().generate_audio(text, **kwargs)
+        filepath = await convert_for_playback(filepath)
+        return cache.put(cache_key, filepath)
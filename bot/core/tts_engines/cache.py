@@ -0,0 +1,306 @@
+"""
+On-disk TTS audio cache.
+
+Synthesized clips are stored under {root}/{key[:2]}/{key}{ext}, keyed by a
+SHA-256 of the engine, synthesis parameters and text, so repeated phrases
+(greetings, confirmations, alerts) are served from disk instead of being
+synthesized again. An LRU index, persisted to index.json, keeps the total
+size under a byte budget.
+"""
+
+import asyncio
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import time
+import unicodedata
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+from .base import logger
+
+# Anchor for TTS data paths, so they don't depend on the working directory
+PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent.parent
+
+# Cache location and size budget
+TTS_CACHE_DIR = PROJECT_ROOT / "data" / "tts" / "cache"
+TTS_CACHE_MAX_BYTES = 200 * 1024 * 1024  # 200 MB
+# Clips handed out (get/put) this recently are never evicted, so a clip whose
+# playback is still queued can't be deleted underneath it; the cache may run
+# over budget until they age out
+TTS_CACHE_EVICT_GRACE = 5 * 60  # Seconds
+INDEX_FILE = "index.json"
+
+# Scratch directory engines synthesize into. It sits next to the cache by default
+# so moving a clip into the cache is a rename, not a copy; set TTS_TMPDIR to put
+# it on tmpfs (e.g. /dev/shm) instead.
+TTS_TMPDIR = Path(os.environ.get("TTS_TMPDIR") or PROJECT_ROOT / "data" / "tts" / "tmp")
+STALE_TEMP_AGE = 10 * 60  # Seconds before a leftover scratch file is removed
+
+# Format clips are cached in: what the playback source feeds Discord, so a
+# cached WAV is loaded as-is instead of being decoded/resampled on every play
+PLAYBACK_SAMPLE_RATE = 48000
+PLAYBACK_CHANNELS = 2
+
+_tmpdir_ready = False
+
+
+def make_temp_audio_file(suffix: str) -> Tuple[int, str]:
+    """
+    Create a scratch file for synthesized audio in TTS_TMPDIR.
+
+    Args:
+        suffix: File extension (e.g., ".mp3")
+
+    Returns:
+        (open file descriptor, path), as tempfile.mkstemp
+    """
+    global _tmpdir_ready
+    if not _tmpdir_ready:
+        TTS_TMPDIR.mkdir(parents=True, exist_ok=True)
+        _tmpdir_ready = True
+    return tempfile.mkstemp(suffix=suffix, dir=TTS_TMPDIR)
+
+
+def cleanup_stale_temp_files(max_age: float = STALE_TEMP_AGE) -> int:
+    """
+    Remove scratch files left behind by interrupted synthesis.
+
+    Args:
+        max_age: Only remove files older than this many seconds
+
+    Returns:
+        Number of files removed
+    """
+    cutoff = time.time() - max_age
+    removed = 0
+    try:
+        entries = list(os.scandir(TTS_TMPDIR))
+    except OSError:
+        return 0
+
+    for entry in entries:
+        try:
+            if entry.is_file() and entry.stat().st_mtime < cutoff:
+                os.unlink(entry.path)
+                removed += 1
+        except OSError:
+            pass
+
+    if removed:
+        logger.info(f"Removed {removed} stale TTS temp file(s) from {TTS_TMPDIR}")
+    return removed
+
+
+def make_cache_key(engine_name: str, text: str, **params: Any) -> str:
+    """
+    Build the cache key for a synthesis request.
+
+    Args:
+        engine_name: Engine identifier (e.g., "edge")
+        text: Text to synthesize (NFC-normalized, so equivalent strings match)
+        **params: Parameters that change the audio (voice, rate, ...)
+
+    Returns:
+        Hex SHA-256 digest
+    """
+    text = unicodedata.normalize("NFC", text)
+    param_str = "|".join(f"{name}={params[name]}" for name in sorted(params))
+    return hashlib.sha256(f"{engine_name}|{param_str}|{text}".encode("utf-8")).hexdigest()
+
+
+def is_tts_cache_file(path: str) -> bool:
+    """Check whether a file path points into the TTS cache directory."""
+    try:
+        return Path(path).resolve().is_relative_to(TTS_CACHE_DIR.resolve())
+    except (OSError, ValueError):
+        return False
+
+
+async def convert_for_playback(path: str) -> str:
+    """
+    Convert a synthesized clip to 48kHz stereo 16-bit WAV with FFmpeg.
+
+    The original file is removed on success. If FFmpeg is unavailable or fails,
+    the original path is returned unchanged (playback converts it instead).
+
+    Args:
+        path: Synthesized audio file (MP3, WAV, ...)
+
+    Returns:
+        Path of the converted WAV, or the original path
+    """
+    fd, wav_path = make_temp_audio_file(".wav")
+    os.close(fd)
+    try:
+        process = await asyncio.create_subprocess_exec(
+            "ffmpeg", "-y",
+            "-loglevel", "error",
+            "-i", path,
+            "-ar", str(PLAYBACK_SAMPLE_RATE),
+            "-ac", str(PLAYBACK_CHANNELS),
+            "-c:a", "pcm_s16le",
+            wav_path,
+            stdout=asyncio.subprocess.DEVNULL,
+            stderr=asyncio.subprocess.PIPE
+        )
+        _, stderr = await process.communicate()
+        if process.returncode != 0:
+            raise RuntimeError(stderr.decode("utf-8", errors="ignore").strip())
+    except Exception as e:
+        logger.debug(f"Could not convert TTS audio {path} for playback: {e}")
+        try:
+            os.unlink(wav_path)
+        except OSError:
+            pass
+        return path
+
+    os.unlink(path)
+    return wav_path
+
+
+class TTSDiskCache:
+    """LRU cache of synthesized audio files, bounded by total size."""
+
+    def __init__(
+        self,
+        root: Path = TTS_CACHE_DIR,
+        max_bytes: int = TTS_CACHE_MAX_BYTES,
+        evict_grace: float = TTS_CACHE_EVICT_GRACE
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            root: Directory holding cached files and the index
+            max_bytes: Total size above which least recently used files are evicted
+            evict_grace: Seconds after a get/put during which a file is not evicted
+        """
+        self.root = Path(root)
+        self.max_bytes = max_bytes
+        self.evict_grace = evict_grace
+        # {key: (path relative to root, size in bytes)}, least recently used first
+        self._index: Optional["OrderedDict[str, Tuple[str, int]]"] = None
+        self._total_bytes = 0
+        # {key: time.monotonic() of last get/put} for entries handed out this run
+        self._last_used: Dict[str, float] = {}
+
+    def _get_index(self) -> "OrderedDict[str, Tuple[str, int]]":
+        """Get the LRU index, loading it from disk on first use."""
+        if self._index is None:
+            self._index = OrderedDict()
+            self._total_bytes = 0
+            index_path = self.root / INDEX_FILE
+            if index_path.exists():
+                try:
+                    with open(index_path, 'r', encoding='utf-8') as f:
+                        for key, relative_path, size in json.load(f):
+                            self._index[key] = (relative_path, size)
+                            self._total_bytes += size
+                except Exception as e:
+                    logger.warning(f"Could not read TTS cache index {index_path}: {e}")
+                    self._index.clear()
+                    self._total_bytes = 0
+        return self._index
+
+    def get(self, key: str) -> Optional[str]:
+        """
+        Look up a cached clip.
+
+        Args:
+            key: Cache key (see make_cache_key)
+
+        Returns:
+            Path to the cached file, or None on a miss
+        """
+        index = self._get_index()
+        entry = index.get(key)
+        if entry is None:
+            return None
+
+        path = self.root / entry[0]
+        if not path.exists():
+            # Removed behind our back - forget it
+            del index[key]
+            self._total_bytes -= entry[1]
+            self._last_used.pop(key, None)
+            return None
+
+        index.move_to_end(key)
+        self._last_used[key] = time.monotonic()
+        return str(path)
+
+    def put(self, key: str, source_path: str) -> str:
+        """
+        Move a freshly synthesized file into the cache.
+
+        Args:
+            key: Cache key (see make_cache_key)
+            source_path: Generated audio file (moved, not copied)
+
+        Returns:
+            Path of the cached file
+        """
+        index = self._get_index()
+        relative_path = f"{key[:2]}/{key}{Path(source_path).suffix}"
+        dest = self.root / relative_path
+        dest.parent.mkdir(parents=True, exist_ok=True)
+        shutil.move(source_path, dest)  # Handles temp dirs on another filesystem
+
+        old = index.pop(key, None)
+        if old is not None:
+            self._total_bytes -= old[1]
+
+        size = dest.stat().st_size
+        index[key] = (relative_path, size)
+        self._total_bytes += size
+        self._last_used[key] = time.monotonic()
+
+        self._evict()
+        self._save_index()
+        return str(dest)
+
+    def _evict(self):
+        """Remove least recently used files until the cache fits its budget."""
+        index = self._index
+        cutoff = time.monotonic() - self.evict_grace
+        # Always keep the newest entry, even if it alone exceeds the budget
+        while self._total_bytes > self.max_bytes and len(index) > 1:
+            key = next(iter(index))
+            if self._last_used.get(key, cutoff) > cutoff:
+                # Index is in access order, so every entry after this one is recent too
+                break
+            relative_path, size = index.pop(key)
+            self._last_used.pop(key, None)
+            self._total_bytes -= size
+            try:
+                os.unlink(self.root / relative_path)
+            except OSError:
+                pass
+            logger.debug(f"Evicted TTS cache entry {key}")
+
+    def _save_index(self):
+        """Persist the LRU index (atomic write)."""
+        try:
+            index_path = self.root / INDEX_FILE
+            temp_path = index_path.with_suffix('.tmp')
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump([[key, rel, size] for key, (rel, size) in self._index.items()], f)
+            temp_path.replace(index_path)
+        except Exception as e:
+            logger.warning(f"Could not write TTS cache index: {e}")
+
+
+# Global cache instance
+_tts_cache: Optional[TTSDiskCache] = None
+
+
+def get_tts_cache() -> TTSDiskCache:
+    """Get the shared TTS audio cache, creating it on first use."""
+    global _tts_cache
+    if _tts_cache is None:
+        _tts_cache = TTSDiskCache()
+    return _tts_cache
@@ -7,10 +7,12 @@ Requires: Internet connection
 """
 
 import asyncio
-import tempfile
-import io
+import json
+import os
+import time
 from typing import Optional, List, Dict, Any
 from .base import TTSEngine, logger
+from .cache import PROJECT_ROOT, make_temp_audio_file
 
 try:
     import edge_tts
@@ -19,10 +21,18 @@ except ImportError:
     EDGE_TTS_AVAILABLE = False
     logger.warning("edge-tts not installed. Install with: pip install edge-tts")
 
+# Voice list persisted across restarts (fetching it is a network request)
+VOICES_CACHE_FILE = PROJECT_ROOT / "data" / "tts" / "edge_voices.json"
+VOICES_CACHE_TTL = 7 * 24 * 60 * 60  # Seconds before the voice list is re-fetched
+
+AUDIO_WRITE_BUFFER = 64 * 1024  # Temp file buffer size for streamed audio chunks
+
 
 class EdgeEngine(TTSEngine):
     """Edge TTS-based engine."""
 
+    engine_name = "edge"
+
     # Common high-quality voices
     COMMON_VOICES = [
         "en-US-AriaNeural",
@@ -33,13 +43,19 @@ class EdgeEngine(TTSEngine):
         "en-IN-NeerjaNeural"
     ]
 
+    # {words per minute: Edge rate string}, shared by all instances
+    _RATE_CACHE: Dict[float, str] = {}
+
+    # Voice list, shared by all instances (per-guild engines) and fetched once
+    _voices_cache: Optional[List[Dict[str, Any]]] = None
+    _voices_lock = asyncio.Lock()
+
     def __init__(self, bot):
         super().__init__(bot)
 
         if not EDGE_TTS_AVAILABLE:
             raise ImportError("edge-tts is not available")
 
-        self.voices_cache = None
         logger.info("EdgeEngine initialized")
 
     async def generate_audio(
@@ -60,68 +76,119 @@ class EdgeEngine(TTSEngine):
         # Convert from words-per-minute to percentage if needed
         rate_str = "+0%"  # Default
         if rate:
-            # Rough conversion: 150 wpm = normal (0%), each 50 wpm = ±50%
-            percent = int(((rate - 150) / 150) * 100)
-            rate_str = f"+{percent}%" if percent >= 0 else f"{percent}%"
-
+            rate_str = self._RATE_CACHE.get(rate)
+            if rate_str is None:
+                # Rough conversion: 150 wpm = normal (0%), each 50 wpm = ±50%
+                percent = int(((rate - 150) / 150) * 100)
+                rate_str = f"+{percent}%" if percent >= 0 else f"{percent}%"
+                self._RATE_CACHE[rate] = rate_str
+
+        temp_path = None
         try:
-            # Generate TTS audio
+            # Generate TTS audio, streaming chunks straight into the temp file
+            # (no in-memory copy of the whole clip)
             tts = edge_tts.Communicate(text, voice, rate=rate_str)
-            audio_data = io.BytesIO()
-
-            async for chunk in tts.stream():
-                if chunk["type"] == "audio":
-                    audio_data.write(chunk["data"])
+            fd, temp_path = make_temp_audio_file(".mp3")
 
-            audio_data.seek(0)
-
-            # Save to temp file
-            temp_file = tempfile.NamedTemporaryFile(delete=False, suffix=".mp3")
-            temp_file.write(audio_data.getvalue())
-            temp_file.close()
+            # 64KB buffer coalesces the many small chunks into few write() calls
+            with os.fdopen(fd, "wb", buffering=AUDIO_WRITE_BUFFER) as temp_file:
+                write = temp_file.write
+                async for chunk in tts.stream():
+                    if chunk["type"] == "audio":
+                        write(chunk["data"])
 
             logger.info(f"[Guild {guild_id}] Edge TTS: Generated audio with voice {voice}")
-            return temp_file.name
+            return temp_path
 
         except Exception as e:
             logger.error(f"Edge TTS generation failed: {e}", exc_info=True)
+            if temp_path:
+                try:
+                    os.unlink(temp_path)
+                except OSError:
+                    pass
             raise
 
     async def list_voices(self) -> List[Dict[str, Any]]:
-        """List available Edge TTS voices."""
-        if self.voices_cache is None:
-            try:
-                all_voices = await edge_tts.list_voices()
-                self.voices_cache = []
-
-                for voice in all_voices:
-                    # Handle different possible key names (API may vary)
-                    voice_id = voice.get("ShortName") or voice.get("Name", "unknown")
-                    voice_name = voice.get("FriendlyName") or voice.get("DisplayName") or voice_id
-                    locale = voice.get("Locale") or voice.get("Language", "unknown")
-                    gender = voice.get("Gender", "unknown")
-
-                    self.voices_cache.append({
-                        "id": voice_id,
-                        "name": voice_name,
-                        "language": locale,
-                        "gender": gender
-                    })
-
-                logger.info(f"Cached {len(self.voices_cache)} Edge TTS voices")
-
-            except Exception as e:
-                logger.error(f"Failed to list Edge TTS voices: {e}", exc_info=True)
-                # Log first voice structure for debugging
+        """List available Edge TTS voices (fetched once, shared by all instances)."""
+        if EdgeEngine._voices_cache is not None:
+            return EdgeEngine._voices_cache
+
+        # Concurrent first callers wait for one fetch instead of each making their own
+        async with EdgeEngine._voices_lock:
+            if EdgeEngine._voices_cache is None:
+                EdgeEngine._voices_cache = self._load_voices_file()
+
+            if EdgeEngine._voices_cache is None:
                 try:
                     all_voices = await edge_tts.list_voices()
-                    if all_voices:
-                        logger.debug(f"Edge TTS voice structure example: {list(all_voices[0].keys())}")
-                except:
-                    pass
-                self.voices_cache = []
+                    voices = []
+
+                    for voice in all_voices:
+                        # Handle different possible key names (API may vary)
+                        voice_id = voice.get("ShortName") or voice.get("Name", "unknown")
+                        voice_name = voice.get("FriendlyName") or voice.get("DisplayName") or voice_id
+                        locale = voice.get("Locale") or voice.get("Language", "unknown")
+                        gender = voice.get("Gender", "unknown")
+
+                        voices.append({
+                            "id": voice_id,
+                            "name": voice_name,
+                            "language": locale,
+                            "gender": gender
+                        })
+
+                    EdgeEngine._voices_cache = voices
+                    logger.info(f"Cached {len(voices)} Edge TTS voices")
+                    self._save_voices_file(voices)
+
+                except Exception as e:
+                    logger.error(f"Failed to list Edge TTS voices: {e}", exc_info=True)
+                    # Log first voice structure for debugging
+                    try:
+                        all_voices = await edge_tts.list_voices()
+                        if all_voices:
+                            logger.debug(f"Edge TTS voice structure example: {list(all_voices[0].keys())}")
+                    except:
+                        pass
+                    # Not cached, so the next call retries
+                    return []
+
+        return EdgeEngine._voices_cache
+
+    def _load_voices_file(self) -> Optional[List[Dict[str, Any]]]:
+        """Load the persisted voice list, or None if missing, stale or unreadable."""
+        try:
+            if time.time() - VOICES_CACHE_FILE.stat().st_mtime > VOICES_CACHE_TTL:
+                return None
+            with open(VOICES_CACHE_FILE, 'r', encoding='utf-8') as f:
+                voices = json.load(f)
+            logger.info(f"Loaded {len(voices)} Edge TTS voices from {VOICES_CACHE_FILE}")
+            return voices
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning(f"Could not read Edge TTS voice cache {VOICES_CACHE_FILE}: {e}")
+            return None
+
+    def _save_voices_file(self, voices: List[Dict[str, Any]]):
+        """Persist the voice list for later restarts (skipped if empty)."""
+        if not voices:
+            return
+        try:
+            VOICES_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+            temp_file = VOICES_CACHE_FILE.with_suffix('.tmp')
+            with open(temp_file, 'w', encoding='utf-8') as f:
+                json.dump(voices, f, ensure_ascii=False)
+            temp_file.replace(VOICES_CACHE_FILE)
+        except Exception as e:
+            logger.warning(f"Could not write Edge TTS voice cache {VOICES_CACHE_FILE}: {e}")
 
-        return self.voices_cache
+    def cache_key_params(self, voice, rate, volume, guild_id) -> Dict[str, Any]:
+        """Edge TTS ignores volume (applied at playback), so leave it out of the key."""
+        params = super().cache_key_params(voice, rate, volume, guild_id)
+        del params["volume"]
+        return params
 
     def get_default_voice(self, guild_id: Optional[int] = None) -> Optional[str]:
         """Get default voice from config."""
@@ -4,7 +4,26 @@ TTS engine factory.
 Creates the appropriate TTS engine based on configuration.
 """
 
-from .base import TTSEngine, logger
+from typing import Dict, Type
+
+from .base import CachingTTSMixin, TTSEngine, logger
+
+# {engine class: engine class with CachingTTSMixin}
+_caching_classes: Dict[Type[TTSEngine], Type[TTSEngine]] = {}
+
+
+def _with_cache(engine_class: Type[TTSEngine]) -> Type[TTSEngine]:
+    """
+    Get a subclass of engine_class whose generate_audio goes through the audio cache.
+
+    The subclass keeps the engine's class name, which callers use to tell
+    engine types apart.
+    """
+    caching_class = _caching_classes.get(engine_class)
+    if caching_class is None:
+        caching_class = type(engine_class.__name__, (CachingTTSMixin, engine_class), {})
+        _caching_classes[engine_class] = caching_class
+    return caching_class
 
 
 def create_tts_engine(bot, engine_type: str = "pyttsx3") -> TTSEngine:
@@ -16,7 +35,7 @@ def create_tts_engine(bot, engine_type: str = "pyttsx3") -> TTSEngine:
         engine_type: Engine type ("pyttsx3", "edge", "piper")
 
     Returns:
-        TTSEngine instance
+        TTSEngine instance (with audio caching, see CachingTTSMixin)
 
     Raises:
         ValueError: If engine_type is unknown
@@ -26,15 +45,15 @@ def create_tts_engine(bot, engine_type: str = "pyttsx3") -> TTSEngine:
 
     if engine_type == "pyttsx3":
         from .pyttsx3_engine import Pyttsx3Engine
-        return Pyttsx3Engine(bot)
+        return _with_cache(Pyttsx3Engine)(bot)
 
     elif engine_type == "edge":
         from .edge_engine import EdgeEngine
-        return EdgeEngine(bot)
+        return _with_cache(EdgeEngine)(bot)
 
     elif engine_type == "piper":
         from .piper_engine import PiperEngine
-        return PiperEngine(bot)
+        return _with_cache(PiperEngine)(bot)
 
     else:
         raise ValueError(f"Unknown TTS engine: {engine_type}")
@@ -8,31 +8,46 @@ Size: Small models (10-50MB)
 """
 
 import asyncio
-import tempfile
+import json
 import subprocess
 import os
-from typing import Optional, List, Dict, Any
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Optional, List, Dict, Any, Tuple
 from pathlib import Path
 from .base import TTSEngine, logger
+from .cache import PROJECT_ROOT, TTS_TMPDIR, make_temp_audio_file
 
-try:
-    # Piper is typically installed as a binary, not a Python package
-    # We'll check if it's available in PATH
-    result = subprocess.run(
-        ["piper", "--version"],
-        capture_output=True,
-        text=True,
-        timeout=2
-    )
-    PIPER_AVAILABLE = result.returncode == 0
-except (FileNotFoundError, subprocess.TimeoutExpired, Exception):
-    PIPER_AVAILABLE = False
+
+@lru_cache(maxsize=1)
+def piper_available() -> bool:
+    """Check whether the piper binary is in PATH (probed once, on first use)."""
+    try:
+        # Piper is typically installed as a binary, not a Python package
+        result = subprocess.run(
+            ["piper", "--version"],
+            capture_output=True,
+            text=True,
+            timeout=2
+        )
+        if result.returncode == 0:
+            return True
+    except (FileNotFoundError, subprocess.TimeoutExpired, Exception):
+        pass
     logger.warning("Piper TTS not found in PATH. Install from: https://github.com/rhasspy/piper")
+    return False
+
+
+# Persistent piper processes (one per model + length scale) kept warm
+MAX_PIPER_PROCESSES = 4
+PIPER_RESPONSE_TIMEOUT = 60.0  # Seconds to wait for one utterance
 
 
 class PiperEngine(TTSEngine):
     """Piper TTS-based engine."""
 
+    engine_name = "piper"
+
     # Common high-quality voices (model names)
     COMMON_VOICES = {
         "en_US-lessac-medium": "English (US) - Lessac (Medium)",
@@ -41,16 +56,35 @@ class PiperEngine(TTSEngine):
         "en_GB-danny-low": "English (GB) - Danny (Low)",
     }
 
+    # list_voices() result, shared by all instances and reused until the model
+    # directory changes
+    _voices_cache: Optional[List[Dict[str, Any]]] = None
+    _voices_cache_mtime: Optional[float] = None
+
+    # Persistent `piper --json-input` processes, so the model is loaded once rather
+    # than per utterance, shared by all instances (one per guild):
+    # {(model, length_scale): process}, LRU order
+    _processes: "OrderedDict[Tuple[str, float], asyncio.subprocess.Process]" = OrderedDict()
+    # One request at a time per process (responses are read line by line)
+    _process_locks: Dict[Tuple[str, float], asyncio.Lock] = {}
+    _spawn_lock = asyncio.Lock()
+    _instances = 0  # Live instances; the processes are stopped with the last one
+    _env: Optional[Dict[str, str]] = None
+    # Background tasks (stderr drains, stopping evicted processes), referenced
+    # here until done so they can't be garbage-collected while running
+    _background_tasks: set = set()
+
     def __init__(self, bot):
         super().__init__(bot)
 
-        if not PIPER_AVAILABLE:
+        if not piper_available():
             raise ImportError("Piper TTS is not available in PATH")
 
         # Model directory (will be created if it doesn't exist)
-        self.model_dir = Path("data/tts/piper/models")
+        self.model_dir = PROJECT_ROOT / "data" / "tts" / "piper" / "models"
         self.model_dir.mkdir(parents=True, exist_ok=True)
 
+        PiperEngine._instances += 1
         logger.info("PiperEngine initialized")
 
     async def generate_audio(
@@ -80,81 +114,199 @@ class PiperEngine(TTSEngine):
             )
 
         # Create temp output file
-        temp_file = tempfile.NamedTemporaryFile(delete=False, suffix=".wav")
-        temp_file.close()
+        fd, temp_path = make_temp_audio_file(".wav")
+        os.close(fd)
 
         try:
-            # Piper command: echo "text" | piper --model model.onnx --output_file output.wav
-            # Rate control via --length-scale (1.0 = normal, <1 = faster, >1 = slower)
+            # Rate control via length_scale (1.0 = normal, <1 = faster, >1 = slower)
             length_scale = 1.0
             if rate:
                 # Convert WPM to length scale (roughly)
                 # 150 wpm = 1.0, 200 wpm = 0.75, 100 wpm = 1.5
                 length_scale = 150 / rate
 
-            cmd = [
-                "piper",
-                "--model", str(model_path),
-                "--output_file", temp_file.name,
-                "--length_scale", str(length_scale)
-            ]
+            key = (str(model_path), length_scale)
+            request = json.dumps({"text": text, "output_file": temp_path}) + "\n"
+
+            while True:
+                process = await self._get_process(key)
+                async with PiperEngine._process_locks[key]:
+                    # Another caller's spawn may have evicted it while we waited
+                    if PiperEngine._processes.get(key) is not process:
+                        continue
 
-            # Run Piper with library path if installed in /opt/piper
-            env = os.environ.copy()
-            if os.path.exists("/opt/piper"):
-                # Add /opt/piper and subdirectories to library path
-                ld_path = env.get("LD_LIBRARY_PATH", "")
-                piper_lib_paths = ["/opt/piper", "/opt/piper/lib"]
-                for path in piper_lib_paths:
-                    if os.path.exists(path) and path not in ld_path:
-                        ld_path = f"{path}:{ld_path}" if ld_path else path
-                env["LD_LIBRARY_PATH"] = ld_path
-
-            # Set espeak-ng data path if not already set
-            if "ESPEAK_DATA_PATH" not in env:
-                # Try common locations
-                espeak_paths = [
-                    "/usr/lib/x86_64-linux-gnu/espeak-ng-data",
-                    "/usr/lib/aarch64-linux-gnu/espeak-ng-data",
-                    "/usr/share/espeak-ng-data",
-                    "/usr/local/share/espeak-ng-data"
-                ]
-                for espeak_path in espeak_paths:
-                    if os.path.exists(espeak_path):
-                        env["ESPEAK_DATA_PATH"] = espeak_path
-                        break
+                    try:
+                        # Piper prints the output path once the utterance is written
+                        process.stdin.write(request.encode())
+                        await process.stdin.drain()
+                        line = await asyncio.wait_for(process.stdout.readline(), PIPER_RESPONSE_TIMEOUT)
+                    except (OSError, asyncio.TimeoutError) as e:
+                        line = b""
+                        logger.error(f"Piper process for {voice} stopped responding: {e}")
+
+                    if not line:
+                        if PiperEngine._processes.get(key) is process:
+                            del PiperEngine._processes[key]
+                        await self._stop_process(process)
+                        self._forget_lock(key)
+                        raise RuntimeError(f"Piper TTS failed for voice {voice} (process exited)")
+                break
+
+            logger.info(f"[Guild {guild_id}] Piper TTS: Generated audio with voice {voice}")
+            return temp_path
 
+        except Exception as e:
+            logger.error(f"Piper TTS generation failed: {e}", exc_info=True)
+            # Clean up temp file on error
+            if os.path.exists(temp_path):
+                os.unlink(temp_path)
+            raise
+
+    async def _get_process(self, key: Tuple[str, float]) -> asyncio.subprocess.Process:
+        """
+        Get the running piper process for a model and length scale, starting it if needed.
+
+        Args:
+            key: (model path, length scale)
+
+        Returns:
+            Piper process reading JSON requests from stdin
+        """
+        processes = PiperEngine._processes
+        async with PiperEngine._spawn_lock:
+            process = processes.get(key)
+            if process is not None and process.returncode is None:
+                processes.move_to_end(key)
+                return process
+
+            model_path, length_scale = key
+            output_dir = str(TTS_TMPDIR)
             process = await asyncio.create_subprocess_exec(
-                *cmd,
+                "piper",
+                "--model", model_path,
+                "--json-input",
+                "--output_dir", output_dir,
+                "--length_scale", str(length_scale),
                 stdin=asyncio.subprocess.PIPE,
                 stdout=asyncio.subprocess.PIPE,
                 stderr=asyncio.subprocess.PIPE,
-                env=env
+                env=self._get_env()
             )
+            # Piper logs every utterance to stderr - keep the pipe drained
+            self._track(asyncio.create_task(self._log_stderr(process, Path(model_path).stem)))
 
-            stdout, stderr = await process.communicate(input=text.encode())
+            processes[key] = process
+            PiperEngine._process_locks.setdefault(key, asyncio.Lock())
+            logger.info(f"Started Piper process for {Path(model_path).stem} (length_scale={length_scale})")
 
-            if process.returncode != 0:
-                error_msg = stderr.decode() if stderr else "Unknown error"
-                logger.error(f"Piper TTS failed: {error_msg}")
-                raise RuntimeError(f"Piper TTS failed: {error_msg}")
+            # Bound the number of loaded models
+            evicted = []
+            while len(processes) > MAX_PIPER_PROCESSES:
+                old_key = next(iter(processes))
+                evicted.append((old_key, processes.pop(old_key), PiperEngine._process_locks[old_key]))
 
-            logger.info(f"[Guild {guild_id}] Piper TTS: Generated audio with voice {voice}")
-            return temp_file.name
+        # Stopped in the background, after any request they are serving - waiting
+        # for that here would hold up this caller (and, before, every other spawn)
+        for old_key, old_process, old_lock in evicted:
+            self._track(asyncio.create_task(self._retire_process(old_key, old_process, old_lock)))
 
-        except Exception as e:
-            logger.error(f"Piper TTS generation failed: {e}", exc_info=True)
-            # Clean up temp file on error
-            if os.path.exists(temp_file.name):
-                os.unlink(temp_file.name)
-            raise
+        return process
+
+    async def _retire_process(
+        self,
+        key: Tuple[str, float],
+        process: asyncio.subprocess.Process,
+        lock: asyncio.Lock
+    ):
+        """Stop an evicted piper process once its in-flight request (if any) is done."""
+        async with lock:
+            await self._stop_process(process)
+            self._forget_lock(key)
+
+    @staticmethod
+    def _forget_lock(key: Tuple[str, float]):
+        """Drop a key's request lock once no process is running for it."""
+        if key not in PiperEngine._processes:
+            PiperEngine._process_locks.pop(key, None)
+
+    @staticmethod
+    def _track(task: asyncio.Task):
+        """Keep a reference to a background task until it finishes."""
+        PiperEngine._background_tasks.add(task)
+        task.add_done_callback(PiperEngine._background_tasks.discard)
+
+    @staticmethod
+    async def _log_stderr(process: asyncio.subprocess.Process, voice: str):
+        """Forward a piper process's stderr to the debug log until it exits."""
+        async for line in process.stderr:
+            logger.debug(f"Piper ({voice}): {line.decode(errors='replace').rstrip()}")
+
+    @staticmethod
+    def _terminate(process: asyncio.subprocess.Process):
+        """Send SIGTERM to a piper process if it is still running."""
+        if process.returncode is None:
+            try:
+                process.terminate()
+            except ProcessLookupError:
+                pass
+
+    @staticmethod
+    async def _stop_process(process: asyncio.subprocess.Process):
+        """Terminate a piper process (already removed from the table) and reap it."""
+        PiperEngine._terminate(process)
+        try:
+            await asyncio.wait_for(process.wait(), 5)
+        except asyncio.TimeoutError:
+            process.kill()
+            await process.wait()
+
+    def _get_env(self) -> Dict[str, str]:
+        """Build the environment for piper processes (library and espeak-ng data paths)."""
+        if PiperEngine._env is not None:
+            return PiperEngine._env
+
+        # Run Piper with library path if installed in /opt/piper
+        env = os.environ.copy()
+        if os.path.exists("/opt/piper"):
+            # Add /opt/piper and subdirectories to library path
+            ld_path = env.get("LD_LIBRARY_PATH", "")
+            piper_lib_paths = ["/opt/piper", "/opt/piper/lib"]
+            for path in piper_lib_paths:
+                if os.path.exists(path) and path not in ld_path:
+                    ld_path = f"{path}:{ld_path}" if ld_path else path
+            env["LD_LIBRARY_PATH"] = ld_path
+
+        # Set espeak-ng data path if not already set
+        if "ESPEAK_DATA_PATH" not in env:
+            # Try common locations
+            espeak_paths = [
+                "/usr/lib/x86_64-linux-gnu/espeak-ng-data",
+                "/usr/lib/aarch64-linux-gnu/espeak-ng-data",
+                "/usr/share/espeak-ng-data",
+                "/usr/local/share/espeak-ng-data"
+            ]
+            for espeak_path in espeak_paths:
+                if os.path.exists(espeak_path):
+                    env["ESPEAK_DATA_PATH"] = espeak_path
+                    break
+
+        PiperEngine._env = env
+        return env
 
     async def list_voices(self) -> List[Dict[str, Any]]:
         """List available Piper voices (models in directory)."""
+        # Adding or removing a model updates the directory mtime
+        try:
+            dir_mtime = self.model_dir.stat().st_mtime
+        except OSError:
+            dir_mtime = None
+        if PiperEngine._voices_cache is not None and dir_mtime == PiperEngine._voices_cache_mtime:
+            return PiperEngine._voices_cache
+
         voices = []
 
         # List downloaded models
-        if self.model_dir.exists():
+        if dir_mtime is not None:
             for model_file in self.model_dir.glob("*.onnx"):
                 voice_id = model_file.stem
                 voice_name = self.COMMON_VOICES.get(voice_id, voice_id)
@@ -180,8 +332,16 @@ class PiperEngine(TTSEngine):
                     "gender": "unknown"
                 })
 
+        PiperEngine._voices_cache = voices
+        PiperEngine._voices_cache_mtime = dir_mtime
         return voices
 
+    def cache_key_params(self, voice, rate, volume, guild_id) -> Dict[str, Any]:
+        """Piper ignores volume (applied at playback), so leave it out of the key."""
+        params = super().cache_key_params(voice, rate, volume, guild_id)
+        del params["volume"]
+        return params
+
     def get_default_voice(self, guild_id: Optional[int] = None) -> Optional[str]:
         """Get default voice from config."""
         if guild_id and hasattr(self.bot, 'config_manager'):
@@ -189,3 +349,24 @@ class PiperEngine(TTSEngine):
             if default:
                 return default
         return "en_US-lessac-medium"
+
+    def cleanup(self):
+        """Release this instance; the last one to go terminates the piper processes."""
+        PiperEngine._instances -= 1
+        if PiperEngine._instances > 0:
+            return
+        PiperEngine._instances = 0
+
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None
+
+        while PiperEngine._processes:
+            _, process = PiperEngine._processes.popitem(last=False)
+            if loop is not None:
+                # Reap in the background (cleanup() is called synchronously)
+                self._track(loop.create_task(self._stop_process(process)))
+            else:
+                self._terminate(process)
+        PiperEngine._process_locks.clear()
@@ -6,9 +6,11 @@ Quality: Low (espeak) to Medium (SAPI on Windows)
 """
 
 import asyncio
-import tempfile
+import os
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional, List, Dict, Any
 from .base import TTSEngine, logger
+from .cache import make_temp_audio_file
 
 try:
     import pyttsx3
@@ -21,20 +23,32 @@ except ImportError:
 class Pyttsx3Engine(TTSEngine):
     """Pyttsx3-based TTS engine."""
 
+    engine_name = "pyttsx3"
+
+    # pyttsx3.init() returns one process-wide engine, which isn't thread-safe, so
+    # all instances (one per guild) share a single worker thread that owns it
+    _executor: Optional[ThreadPoolExecutor] = None
+    _instances = 0  # Live instances; the worker thread is stopped with the last one
+    _engine = None  # Created on the worker thread, dropped when that thread is stopped
+    _system_voice = None  # Engine's initial voice, restored when none requested
+
+    # Voices, shared by all instances and discovered on the first list_voices() call
+    available_voices: Optional[List[Dict[str, Any]]] = None
+    _voices_lock = asyncio.Lock()
+
     def __init__(self, bot):
         super().__init__(bot)
 
         if not PYTTSX3_AVAILABLE:
             raise ImportError("pyttsx3 is not available")
 
-        # Discover available voices
-        self.available_voices = self._discover_voices()
-        logger.info(f"Pyttsx3Engine initialized with {len(self.available_voices)} voices")
+        Pyttsx3Engine._instances += 1
+        logger.info("Pyttsx3Engine initialized")
 
     def _discover_voices(self) -> List[Dict[str, Any]]:
-        """Discover all available pyttsx3 voices."""
+        """Discover all available pyttsx3 voices (runs on the worker thread)."""
         try:
-            engine = pyttsx3.init()
+            engine = self._get_engine()
             system_voices = engine.getProperty("voices")
             discovered = []
 
@@ -51,7 +65,6 @@ class Pyttsx3Engine(TTSEngine):
 
                 discovered.append(voice_info)
 
-            del engine
             return discovered
 
         except Exception as e:
@@ -69,8 +82,8 @@ class Pyttsx3Engine(TTSEngine):
     ) -> str:
         """Generate TTS audio using pyttsx3."""
         loop = asyncio.get_running_loop()
-        temp_file = tempfile.NamedTemporaryFile(delete=False, suffix=".wav")
-        temp_file.close()
+        fd, temp_path = make_temp_audio_file(".wav")
+        os.close(fd)
 
         # Get default rate from config if not provided
         if rate is None:
@@ -79,30 +92,73 @@ class Pyttsx3Engine(TTSEngine):
                 rate = self.bot.config_manager.get("TTS", "tts_default_rate", guild_id)
 
         def generate_tts():
-            engine = pyttsx3.init()
+            engine = self._get_engine()
             engine.setProperty("rate", rate)
             engine.setProperty("volume", volume)
 
-            # Set voice if provided
+            # Set voice if provided (the engine keeps the last voice, so reset it otherwise)
             if voice:
                 engine.setProperty("voice", voice)
                 logger.info(f"[Guild {guild_id}] Pyttsx3: Using voice {voice}")
             else:
+                if Pyttsx3Engine._system_voice:
+                    engine.setProperty("voice", Pyttsx3Engine._system_voice)
                 logger.info(f"[Guild {guild_id}] Pyttsx3: Using system default voice")
 
-            engine.save_to_file(text, temp_file.name)
+            engine.save_to_file(text, temp_path)
             engine.runAndWait()
             # Don't call stop() - causes segfaults
 
-        await loop.run_in_executor(None, generate_tts)
-        return temp_file.name
+        await loop.run_in_executor(self._get_executor(), generate_tts)
+        return temp_path
+
+    @staticmethod
+    def _get_executor() -> ThreadPoolExecutor:
+        """Get the shared worker thread, starting it if needed."""
+        if Pyttsx3Engine._executor is None:
+            Pyttsx3Engine._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="pyttsx3")
+        return Pyttsx3Engine._executor
+
+    @staticmethod
+    def _get_engine():
+        """Get the worker thread's pyttsx3 engine, initializing it on first use."""
+        if Pyttsx3Engine._engine is None:
+            Pyttsx3Engine._engine = pyttsx3.init()
+            Pyttsx3Engine._system_voice = Pyttsx3Engine._engine.getProperty("voice")
+        return Pyttsx3Engine._engine
 
     async def list_voices(self) -> List[Dict[str, Any]]:
-        """List available pyttsx3 voices."""
-        return self.available_voices
+        """List available pyttsx3 voices (discovered on first call)."""
+        if Pyttsx3Engine.available_voices is None:
+            async with Pyttsx3Engine._voices_lock:
+                if Pyttsx3Engine.available_voices is None:
+                    loop = asyncio.get_running_loop()
+                    Pyttsx3Engine.available_voices = await loop.run_in_executor(
+                        self._get_executor(), self._discover_voices
+                    )
+                    logger.info(f"Discovered {len(Pyttsx3Engine.available_voices)} pyttsx3 voices")
+        return Pyttsx3Engine.available_voices
 
     def get_default_voice(self, guild_id: Optional[int] = None) -> Optional[str]:
         """Get default voice from config."""
         if guild_id and hasattr(self.bot, 'config_manager'):
             return self.bot.config_manager.get("TTS", "tts_voice_pyttsx3", guild_id)
         return None
+
+    def cleanup(self):
+        """Release this instance; the last one to go stops the shared worker thread."""
+        Pyttsx3Engine._instances -= 1
+        if Pyttsx3Engine._instances > 0:
+            return
+        Pyttsx3Engine._instances = 0
+
+        if Pyttsx3Engine._executor is not None:
+            # Queued requests are dropped rather than run on a thread that's going away
+            Pyttsx3Engine._executor.shutdown(wait=False, cancel_futures=True)
+            Pyttsx3Engine._executor = None
+
+        # The engine belongs to the old worker thread (SAPI5/COM engines are tied
+        # to it), so the next worker thread initializes its own
+        Pyttsx3Engine._engine = None
+        Pyttsx3Engine._system_voice = None
+        Pyttsx3Engine.available_voices = None
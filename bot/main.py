@@ -1,36 +1,29 @@
+import asyncio
+import atexit
+import queue
 import discord
 from discord.ext import commands, voice_recv
 import os
+import sys
 from datetime import datetime, UTC
+from functools import lru_cache
 import logging
-from logging.handlers import TimedRotatingFileHandler
+from logging.handlers import QueueHandler, QueueListener, TimedRotatingFileHandler
 from pathlib import Path
+from typing import Dict, FrozenSet, Optional, Tuple
 from dotenv import load_dotenv
 
 # Load .env file FIRST (before any config imports)
 load_dotenv()
 
-# Configure Vosk library log level based on LOG_LEVEL environment variable
-try:
-    import vosk
-    # Map Python log levels to Vosk log levels
-    # Vosk: -1=suppress, 0=fatal, 1=error, 2=warning, 3=info, 4=debug
-    # Python: CRITICAL=50, ERROR=40, WARNING=30, INFO=20, DEBUG=10
-    log_level_name = os.getenv("LOG_LEVEL", "INFO").upper()
-    vosk_log_mapping = {
-        "CRITICAL": 0,  # Fatal errors only
-        "ERROR": 1,     # Errors
-        "WARNING": 2,   # Warnings
-        "INFO": -1,     # Suppress (INFO is too verbose for Vosk)
-        "DEBUG": 3      # Show Vosk info when debugging
-    }
-    vosk_level = vosk_log_mapping.get(log_level_name, -1)
-    vosk.SetLogLevel(vosk_level)
-except ImportError:
-    pass  # Vosk not installed, skip
-
 from bot.config import config
 from bot.core.admin.data_collector import initialize_data_collector
+from bot.core.audio.voice_state import load_voice_state
+from bot.version import get_version, VERSION_HISTORY
+
+# Version is fixed for the process - resolve it once, not on every on_ready
+BOT_VERSION = get_version()
+BOT_VERSION_NOTE = VERSION_HISTORY.get(BOT_VERSION, "")
 
 # IMPORTANT: Change to project root so model/ directory can be found
 project_root = Path(__file__).parent.parent
@@ -49,83 +42,79 @@ file_handler = TimedRotatingFileHandler(
     when="midnight",
     interval=1,
     backupCount=7,
-    encoding="utf-8"
+    encoding="utf-8",
+    delay=True  # Open the log file on the first record, not at import
 )
 file_handler.setFormatter(formatter)
 
 console_handler = logging.StreamHandler()
 console_handler.setFormatter(formatter)
 
-# Clear handlers for all discrod logging and implement mine
-for name, log in logging.root.manager.loggerDict.items():
-    if name.startswith("discord"):
-        if isinstance(log, logging.Logger):
-            log.handlers.clear()
-            log.setLevel(logging.INFO)
-            log.addHandler(console_handler)
-            log.addHandler(file_handler)
-            log.propagate = False
+# Loggers only enqueue records; a background thread does the console/file I/O,
+# so logging never blocks the event loop on disk writes
+log_queue = queue.SimpleQueue()
+queue_handler = QueueHandler(log_queue)
+log_listener = QueueListener(log_queue, console_handler, file_handler, respect_handler_level=True)
+log_listener.start()
+atexit.register(log_listener.stop)
 
 # Configure YOUR bot's logger with log level from environment
 log_level_name = os.getenv("LOG_LEVEL", "INFO").upper()
 log_level = getattr(logging, log_level_name, logging.INFO)
 
-logger = logging.getLogger("discordbot")
-logger.setLevel(log_level)
-logger.addHandler(console_handler)
-logger.addHandler(file_handler)
-logger.propagate = False
+# The handler lives only on the top-level discord.py and bot loggers; their
+# children (discord.gateway, discordbot.tts_engines, ...) propagate up to it,
+# so each record is dispatched once
+for top_level_name in ("discord", "discordbot"):
+    top_level_logger = logging.getLogger(top_level_name)
+    top_level_logger.handlers.clear()
+    top_level_logger.setLevel(log_level)
+    top_level_logger.addHandler(queue_handler)
+    top_level_logger.propagate = False
 
-# Also apply to discord loggers
-for name, log in logging.root.manager.loggerDict.items():
-    if name.startswith("discord"):
-        if isinstance(log, logging.Logger):
-            log.setLevel(log_level)
+logger = logging.getLogger("discordbot")
 
 
 def update_log_level(level_name: str):
     """Update log level for all bot loggers dynamically."""
     level = getattr(logging, level_name.upper(), logging.INFO)
-    logger.setLevel(level)
-    for name, log in logging.root.manager.loggerDict.items():
-        if name.startswith("discord"):
-            if isinstance(log, logging.Logger):
-                log.setLevel(level)
+    # Child loggers inherit their level from these two (see logging setup above)
+    for top_level_name in ("discord", "discordbot"):
+        logging.getLogger(top_level_name).setLevel(level)
 
-    # Also update Vosk log level to match
-    try:
-        import vosk
-        vosk_log_mapping = {
-            "CRITICAL": 0,  # Fatal errors only
-            "ERROR": 1,     # Errors
-            "WARNING": 2,   # Warnings
-            "INFO": -1,     # Suppress (INFO is too verbose for Vosk)
-            "DEBUG": 3      # Show Vosk info when debugging
-        }
-        vosk_level = vosk_log_mapping.get(level_name.upper(), -1)
-        vosk.SetLogLevel(vosk_level)
-    except (ImportError, AttributeError):
-        pass  # Vosk not available
+    # Also update Vosk log level to match (if the Vosk engine has been loaded;
+    # otherwise it picks up the bot's level when it's first imported)
+    vosk_engine = sys.modules.get("bot.core.audio.speech_engines.vosk")
+    if vosk_engine is not None:
+        vosk_engine.set_vosk_log_level(level_name)
 
     logger.info(f"Updated log level to {level_name.upper()}")
 
 
+# Messages matched by the log filters below
+_RTCP_NEEDLE = "Received unexpected rtcp packet"
+_RECONNECT_NEEDLE = "Attempting a reconnect"
+
+
 class IgnoreRTCPFilter(logging.Filter):
     def filter(self, record):
         # Suppress only the specific unwanted message
-        msg = getattr(record, "msg", "")
-        if "Received unexpected rtcp packet" in str(msg):
-            return False
-        return True
+        # voice_recv logs it with this constant format string, so a prefix check is exact
+        msg = record.msg
+        if type(msg) is str:
+            return not msg.startswith(_RTCP_NEEDLE)
+        return _RTCP_NEEDLE not in str(msg)
 
 
 class ConnectionErrorFilter(logging.Filter):
     """Filter to suppress verbose connection error tracebacks and show cleaner messages."""
     def filter(self, record):
-        msg = getattr(record, "msg", "")
+        # Only records carrying a traceback can be the verbose reconnect message
+        if not record.exc_info:
+            return True
 
         # Suppress the verbose "Attempting a reconnect" traceback
-        if "Attempting a reconnect" in str(msg) and record.exc_info:
+        if _RECONNECT_NEEDLE in str(record.msg):
             # Log a cleaner message without the full traceback
             if record.exc_info and record.exc_info[1]:
                 exc = record.exc_info[1]
@@ -161,6 +150,10 @@ intents = discord.Intents.default()
 intents.message_content = True
 intents.members = True
 
+# Cog folders: bot/cogs and its domain subfolders
+COGS_BASE = Path(__file__).parent / "cogs"
+COG_DOMAINS = ["activity", "audio", "admin", "utility"]
+
 bot = commands.Bot(command_prefix=config.command_prefix, intents=intents, help_command=None)
 bot.start_time = datetime.now(UTC)
 
@@ -173,126 +166,195 @@ data_collector = initialize_data_collector(
 )
 
 
-async def rejoin_saved_voice_channels():
+# Dotted names of all cog extensions, discovered once per process
+_COG_MANIFEST: Optional[Tuple[str, ...]] = None
+
+
+def _discover_cogs(cogs_base: Path = COGS_BASE) -> Tuple[str, ...]:
+    """
+    Find all cog extensions (domain folders first, then top-level files like errors.py).
+
+    The scan runs once; later calls return the cached manifest.
+
+    Args:
+        cogs_base: Path to the bot/cogs directory (default: COGS_BASE)
+
+    Returns:
+        Dotted extension names (e.g., "bot.cogs.audio.tts")
+    """
+    global _COG_MANIFEST
+    if _COG_MANIFEST is not None:
+        return _COG_MANIFEST
+
+    extensions = []
+    folders = [(cogs_base / domain, f"bot.cogs.{domain}.") for domain in COG_DOMAINS]
+    folders.append((cogs_base, "bot.cogs."))
+
+    for folder, package in folders:
+        try:
+            with os.scandir(folder) as entries:
+                # scandir has the file type from the directory listing - no stat per entry
+                extensions.extend(
+                    package + entry.name[:-3]
+                    for entry in entries
+                    if entry.name.endswith(".py") and not entry.name.startswith("__") and entry.is_file()
+                )
+        except FileNotFoundError:
+            continue
+
+    _COG_MANIFEST = tuple(extensions)
+    return _COG_MANIFEST
+
+
+# Maximum concurrent voice connects when rejoining saved channels
+REJOIN_CONCURRENCY = 8
+
+
+class AutoRejoinContext:
+    """Minimal stand-in for a command context, for starting a speech listener on rejoin."""
+
+    __slots__ = ("guild", "voice_client")
+
+    def __init__(self, guild, voice_client):
+        self.guild = guild
+        self.voice_client = voice_client
+
+
+async def _rejoin_voice_channel(guild, channel, users_in_channel, state_data):
+    """
+    Connect to a saved voice channel and restore speech listening and the transcript session.
+
+    Args:
+        guild: Guild to rejoin in
+        channel: Voice channel to connect to
+        users_in_channel: Non-bot members currently in the channel
+        state_data: Saved voice state for the guild
+    """
+    guild_id = guild.id
+
+    # Rejoin the channel
+    logger.info(f"Rejoining {channel.name} in {guild.name} ({len(users_in_channel)} users present)")
+    vc = await channel.connect(cls=voice_recv.VoiceRecvClient, self_deaf=False)
+
+    # Start listening for speech (get the VoiceSpeechCog)
+    voice_cog = bot.get_cog("VoiceSpeechCog")
+    if voice_cog:
+        # Start keepalive task if needed
+        if not voice_cog._keepalive_task:
+            voice_cog._keepalive_task = bot.loop.create_task(voice_cog._keepalive_loop())
+
+        # Create a minimal context object for speech listener
+        ctx = AutoRejoinContext(guild, vc)
+        engine = voice_cog._create_speech_listener(ctx)
+        await engine.start_listening(vc)
+        voice_cog.active_sinks[guild_id] = {
+            'engine': engine,
+            'sink': engine.get_sink()
+        }
+
+        # Resume or start transcript session
+        if users_in_channel:
+            first_member = users_in_channel[0]
+            existing_session_id = state_data.get("session_id")
+            voice_cog.transcript_manager.resume_or_start_session(
+                channel_id=str(channel.id),
+                guild_id=str(guild_id),
+                guild_name=guild.name,
+                channel_name=channel.name,
+                first_user_id=str(first_member.id),
+                first_username=first_member.display_name,
+                existing_session_id=existing_session_id
+            )
+
+        logger.info(f"✅ Rejoined and started listening in {channel.name} ({guild.name})")
+    else:
+        logger.warning(f"Rejoined {channel.name} but VoiceSpeech cog not available")
+
+
+async def rejoin_saved_voice_channels(voice_state: Optional[Dict[str, Dict[str, str]]] = None):
     """
     Rejoin voice channels from saved state if users are present.
     Called on bot startup to restore voice connections.
+
+    Eligible channels are connected concurrently (at most REJOIN_CONCURRENCY at once).
+
+    Args:
+        voice_state: Saved voice state, if already loaded (read from file otherwise)
     """
     try:
-        from bot.core.audio.voice_state import load_voice_state
-
-        voice_state = load_voice_state()
+        if voice_state is None:
+            voice_state = load_voice_state()
         if not voice_state:
             logger.info("No saved voice channels to rejoin")
             return
 
         rejoined_count = 0
         skipped_count = 0
-        skipped_details = []  # Track skipped channels with details
+        eligible = []  # (guild, channel, users_in_channel, state_data)
 
         for guild_id_str, state_data in voice_state.items():
+            # Skip malformed entries
             try:
                 guild_id = int(guild_id_str)
                 channel_id = int(state_data.get("channel_id"))
+            except (AttributeError, TypeError, ValueError) as e:
+                logger.error(f"Invalid saved voice state for guild {guild_id_str}: {e}")
+                skipped_count += 1
+                continue
 
-                # Get guild and channel
-                guild = bot.get_guild(guild_id)
-                if not guild:
-                    logger.warning(f"Guild {guild_id} not found, skipping rejoin")
-                    skipped_count += 1
-                    skipped_details.append(f"Guild {guild_id} (not found)")
-                    continue
-
-                channel = guild.get_channel(channel_id)
-                if not channel or not isinstance(channel, discord.VoiceChannel):
-                    logger.warning(f"Voice channel {channel_id} not found in {guild.name}, skipping rejoin")
-                    skipped_count += 1
-                    skipped_details.append(f"{guild.name}:#{channel_id} (channel not found)")
-                    continue
-
-                # Check if there are non-bot users in the channel
-                users_in_channel = [m for m in channel.members if not m.bot]
-                if not users_in_channel:
-                    logger.info(f"No users in {channel.name} ({guild.name}), skipping rejoin")
-                    skipped_count += 1
-                    skipped_details.append(f"{guild.name}:#{channel.name} (no users)")
-                    continue
-
-                # Check if already connected
-                if guild.voice_client and guild.voice_client.is_connected():
-                    logger.info(f"Already connected to voice in {guild.name}, skipping rejoin")
-                    skipped_count += 1
-                    skipped_details.append(f"{guild.name}:#{channel.name} (already connected)")
-                    continue
-
-                # Rejoin the channel
-                logger.info(f"Rejoining {channel.name} in {guild.name} ({len(users_in_channel)} users present)")
-                vc = await channel.connect(cls=voice_recv.VoiceRecvClient, self_deaf=False)
-
-                # Start listening for speech (get the VoiceSpeechCog)
-                voice_cog = bot.get_cog("VoiceSpeechCog")
-                if voice_cog:
-                    # Start keepalive task if needed
-                    if not voice_cog._keepalive_task:
-                        voice_cog._keepalive_task = bot.loop.create_task(voice_cog._keepalive_loop())
-
-                    # Create a minimal context object for speech listener
-                    class AutoRejoinContext:
-                        def __init__(self, guild, voice_client):
-                            self.guild = guild
-                            self.voice_client = voice_client
-
-                    ctx = AutoRejoinContext(guild, vc)
-                    engine = voice_cog._create_speech_listener(ctx)
-                    await engine.start_listening(vc)
-                    voice_cog.active_sinks[guild_id] = {
-                        'engine': engine,
-                        'sink': engine.get_sink()
-                    }
-
-                    # Resume or start transcript session
-                    if users_in_channel:
-                        first_member = users_in_channel[0]
-                        existing_session_id = state_data.get("session_id")
-                        voice_cog.transcript_manager.resume_or_start_session(
-                            channel_id=str(channel.id),
-                            guild_id=str(guild_id),
-                            guild_name=guild.name,
-                            channel_name=channel.name,
-                            first_user_id=str(first_member.id),
-                            first_username=first_member.display_name,
-                            existing_session_id=existing_session_id
-                        )
-
-                    logger.info(f"✅ Rejoined and started listening in {channel.name} ({guild.name})")
-                else:
-                    logger.warning(f"Rejoined {channel.name} but VoiceSpeech cog not available")
+            # Get guild and channel
+            guild = bot.get_guild(guild_id)
+            if not guild:
+                logger.warning(f"Guild {guild_id} not found, skipping rejoin")
+                skipped_count += 1
+                continue
 
-                rejoined_count += 1
+            channel = guild.get_channel(channel_id)
+            if not channel or not isinstance(channel, discord.VoiceChannel):
+                logger.warning(f"Voice channel {channel_id} not found in {guild.name}, skipping rejoin")
+                skipped_count += 1
+                continue
 
-            except Exception as e:
-                logger.error(f"Failed to rejoin voice channel in guild {guild_id_str}: {e}")
+            # Check if there are non-bot users in the channel
+            users_in_channel = [m for m in channel.members if not m.bot]
+            if not users_in_channel:
+                logger.info(f"No users in {channel.name} ({guild.name}), skipping rejoin")
                 skipped_count += 1
-                # Try to get guild/channel names for error case
-                try:
-                    guild = bot.get_guild(int(guild_id_str))
-                    channel_id = int(state_data.get("channel_id"))
-                    if guild:
-                        channel = guild.get_channel(channel_id)
-                        if channel:
-                            skipped_details.append(f"{guild.name}:#{channel.name} (error: {str(e)[:50]})")
-                        else:
-                            skipped_details.append(f"{guild.name}:#{channel_id} (error)")
-                    else:
-                        skipped_details.append(f"Guild {guild_id_str} (error)")
-                except:
-                    skipped_details.append(f"Guild {guild_id_str} (error)")
                 continue
 
+            # Check if already connected
+            if guild.voice_client and guild.voice_client.is_connected():
+                logger.info(f"Already connected to voice in {guild.name}, skipping rejoin")
+                skipped_count += 1
+                continue
+
+            eligible.append((guild, channel, users_in_channel, state_data))
+
+        # Connects are independent - run them concurrently, bounded so a large
+        # saved state doesn't open every voice connection at once
+        semaphore = asyncio.Semaphore(REJOIN_CONCURRENCY)
+
+        async def rejoin_bounded(guild, channel, users_in_channel, state_data):
+            async with semaphore:
+                await _rejoin_voice_channel(guild, channel, users_in_channel, state_data)
+
+        results = await asyncio.gather(
+            *(rejoin_bounded(*entry) for entry in eligible),
+            return_exceptions=True
+        )
+
+        for (guild, channel, _, _), result in zip(eligible, results):
+            if isinstance(result, Exception):
+                logger.error(f"Failed to rejoin {channel.name} in {guild.name}: {result}")
+                skipped_count += 1
+            else:
+                rejoined_count += 1
+
         if rejoined_count > 0:
             logger.info(f"🔊 Rejoined {rejoined_count} voice channel(s) from saved state")
         if skipped_count > 0:
-            logger.info(f"⏭️  Skipped {skipped_count} channel(s): {', '.join(skipped_details)}")
+            # Each skip was logged with its reason above
+            logger.info(f"⏭️  Skipped {skipped_count} channel(s)")
 
     except Exception as e:
         logger.error(f"Error loading saved voice channels: {e}", exc_info=True)
@@ -301,38 +363,44 @@ async def rejoin_saved_voice_channels():
 @bot.event
 async def on_ready():
     # Log bot version
-    from bot.version import get_version, VERSION_HISTORY
-    version = get_version()
-    logger.info(f"🤖 Bot Version: {version}")
-    if version in VERSION_HISTORY:
-        logger.info(f"   {VERSION_HISTORY[version]}")
+    logger.info(f"🤖 Bot Version: {BOT_VERSION}")
+    if BOT_VERSION_NOTE:
+        logger.info(f"   {BOT_VERSION_NOTE}")
 
     logger.info(f"✅ Logged in as {bot.user} (ID: {bot.user.id})")
+
+    # Read the saved voice state in the background while cogs load
+    voice_state_task = asyncio.create_task(asyncio.to_thread(load_voice_state))
+
     # Start data collection
     await data_collector.start()
 
     # Initialize unified config system BEFORE loading cogs
-    from bot.core.config_system import ConfigManager
-    config_manager = ConfigManager()
-    bot.config_manager = config_manager  # Make accessible to cogs
-    logger.info("⚙️ Unified configuration system initialized")
+    # (kept across reconnects - loaded cogs registered their schemas on it)
+    if hasattr(bot, 'config_manager'):
+        config_manager = bot.config_manager
+    else:
+        from bot.core.config_system import ConfigManager
+        config_manager = ConfigManager()
+        bot.config_manager = config_manager  # Make accessible to cogs
+        logger.info("⚙️ Unified configuration system initialized")
 
     # Load cogs from new structure (cogs can now register schemas)
-    cog_domains = ["activity", "audio", "admin", "utility"]
-    cogs_base = os.path.join(os.path.dirname(__file__), "cogs")
-
-    for domain in cog_domains:
-        domain_path = os.path.join(cogs_base, domain)
-        if os.path.exists(domain_path):
-            for filename in os.listdir(domain_path):
-                if filename.endswith(".py") and not filename.startswith("__"):
-                    await bot.load_extension(f"bot.cogs.{domain}.{filename[:-3]}")
-
-    # Load top-level cog files (like errors.py)
-    if os.path.exists(cogs_base):
-        for filename in os.listdir(cogs_base):
-            if filename.endswith(".py") and not filename.startswith("__"):
-                await bot.load_extension(f"bot.cogs.{filename[:-3]}")
+    # on_ready fires again after a reconnect - extensions are already loaded then
+    if bot.extensions:
+        logger.info("Extensions already loaded, skipping cog loading")
+    else:
+        extensions = _discover_cogs()
+
+        # Extensions are independent - load them concurrently, so one cog's async
+        # setup doesn't hold up the rest, and a failing cog doesn't stop startup
+        results = await asyncio.gather(
+            *(bot.load_extension(extension) for extension in extensions),
+            return_exceptions=True
+        )
+        for extension, result in zip(extensions, results):
+            if isinstance(result, Exception):
+                logger.error(f"Failed to load extension {extension}: {result}", exc_info=result)
 
     # Apply system config settings from ConfigManager
     try:
@@ -383,14 +451,17 @@ async def on_ready():
         except Exception as e:
             logger.error(f"Failed to connect web dashboard: {e}", exc_info=True)
 
-    # Start web server in background if enabled (after ConfigManager is ready)
+    # Start web server in background if enabled (after ConfigManager is ready).
+    # The task is kept on the bot so it isn't garbage collected, isn't started
+    # twice when on_ready fires again, and can be cancelled on shutdown
     if sys_cfg.enable_web_dashboard:
-        import asyncio
-        asyncio.create_task(start_web_server())
-        logger.info("🌐 Web server task created - starting in background...")
+        web_task = getattr(bot, "web_server_task", None)
+        if web_task is None or web_task.done():
+            bot.web_server_task = asyncio.create_task(start_web_server(), name="web_server")
+            logger.info("🌐 Web server task created - starting in background...")
 
     # Rejoin voice channels from saved state if users are present
-    await rejoin_saved_voice_channels()
+    await rejoin_saved_voice_channels(await voice_state_task)
 
 
 @bot.event
@@ -411,6 +482,23 @@ async def on_connect():
     logger.info("🔗 Connected to Discord gateway")
 
 
+@lru_cache(maxsize=4)
+def _parse_allowed_bot_ids(allowed_ids_str: str) -> FrozenSet[int]:
+    """
+    Parse the comma-separated allowed_bot_ids config value.
+
+    Cached on the string, so a config change is picked up automatically.
+
+    Raises:
+        ValueError: If an entry is not an integer
+    """
+    return frozenset(
+        int(id_str.strip())
+        for id_str in allowed_ids_str.split(",")
+        if id_str.strip()
+    )
+
+
 @bot.event
 async def on_message(message):
     """
@@ -424,32 +512,27 @@ async def on_message(message):
         await bot.process_commands(message)
         return
 
-    # Bot message - check if command and if allowed
+    # Bot message - only command attempts need the allowed_bot_ids check
     prefix = bot.command_prefix
     if isinstance(prefix, list):
         prefix = tuple(prefix)
-    is_command = message.content.startswith(prefix)
+    if not message.content.startswith(prefix):
+        return
 
     if not hasattr(bot, 'config_manager'):
-        if is_command:
-            logger.warning(f"Bot {message.author.name} ({message.author.id}) tried command but config_manager not ready")
+        logger.warning(f"Bot {message.author.name} ({message.author.id}) tried command but config_manager not ready")
         return
 
     sys_cfg = bot.config_manager.for_guild("System")
     allowed_ids_str = sys_cfg.allowed_bot_ids
 
     if not allowed_ids_str:
-        if is_command:
-            logger.info(f"Bot {message.author.name} ({message.author.id}) blocked - allowed_bot_ids is empty")
+        logger.info(f"Bot {message.author.name} ({message.author.id}) blocked - allowed_bot_ids is empty")
         return
 
-    # Parse comma-separated bot IDs
+    # Parse comma-separated bot IDs (cached per config string)
     try:
-        allowed_ids = [
-            int(id_str.strip())
-            for id_str in allowed_ids_str.split(",")
-            if id_str.strip()
-        ]
+        allowed_ids = _parse_allowed_bot_ids(allowed_ids_str)
     except ValueError:
         logger.warning(f"Invalid allowed_bot_ids config: {allowed_ids_str}")
         return
@@ -461,8 +544,8 @@ async def on_message(message):
         ctx = await bot.get_context(message)
         if ctx.command:
             await bot.invoke(ctx)
-    elif is_command:
-        logger.info(f"Bot {message.author.name} ({message.author.id}) blocked - not in allowed_bot_ids. Allowed: {allowed_ids}")
+    else:
+        logger.info(f"Bot {message.author.name} ({message.author.id}) blocked - not in allowed_bot_ids. Allowed: {sorted(allowed_ids)}")
 
 
 # -----------------------
@@ -507,7 +590,14 @@ async def main():
         if not bot.is_closed():
             await bot.close()
 
+        web_task = getattr(bot, "web_server_task", None)
+        if web_task is not None and not web_task.done():
+            web_task.cancel()
+            try:
+                await web_task
+            except asyncio.CancelledError:
+                pass
+
 
 if __name__ == "__main__":
-    import asyncio
     asyncio.run(main())
@@ -310,6 +310,17 @@ class TestConfigManager(unittest.TestCase):
         cfg_guild = self.manager.for_guild("TestCog", guild_id=123)
         self.assertEqual(cfg_guild.volume, 0.3)
 
+    def test_config_proxy_reused(self):
+        """Test that for_guild hands out one proxy per cog/guild that tracks updates."""
+        cfg = self.manager.for_guild("TestCog")
+        self.assertIs(cfg, self.manager.for_guild("TestCog"))
+        self.assertIsNot(cfg, self.manager.for_guild("TestCog", guild_id=123))
+
+        # Cached proxy still sees new values
+        self.assertEqual(cfg.volume, 0.5)
+        self.manager.set("TestCog", "volume", 0.6)
+        self.assertEqual(cfg.volume, 0.6)
+
     def test_save_and_load_global(self):
         """Test saving and loading global config."""
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -0,0 +1,170 @@
+"""
+Unit tests for transcript session persistence.
+
+Tests:
+- merge_session_deltas replay of the JSONL delta log
+- Torn last line after a crash mid-flush
+- Flush (delta append) and end_session (full rewrite) round trip
+"""
+
+import asyncio
+import json
+import tempfile
+import unittest
+from pathlib import Path
+from types import SimpleNamespace
+
+from bot.core.transcript_session import (
+    DELTAS_SUFFIX,
+    TranscriptSessionManager,
+    merge_session_deltas,
+)
+
+
+def _session_data(**overrides) -> dict:
+    """Session .json contents as written when the session started."""
+    data = {
+        "session_id": "s1",
+        "guild_id": "1",
+        "guild_name": "Guild",
+        "channel_id": "2",
+        "channel_name": "General",
+        "start_time": "2025-01-01T00:00:00.000000",
+        "end_time": None,
+        "participants": [{"user_id": "10", "username": "alice"}],
+        "participant_events": [],
+        "transcript": [],
+        "file_path": None,
+        "stats": {"total_messages": 0, "duration_seconds": None, "unique_speakers": 1},
+    }
+    data.update(overrides)
+    return data
+
+
+def _entry(text: str) -> dict:
+    return {
+        "timestamp": "2025-01-01T00:00:01.000000",
+        "user_id": "10",
+        "username": "alice",
+        "text": text,
+        "confidence": 1.0,
+    }
+
+
+class TestMergeSessionDeltas(unittest.TestCase):
+    """Test replaying a session's delta log."""
+
+    def setUp(self):
+        """Create a temporary session file path."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.session_file = Path(self.temp_dir.name) / "20250101_000000_s1.json"
+        self.deltas_file = self.session_file.with_suffix(DELTAS_SUFFIX)
+
+    def tearDown(self):
+        """Clean up temporary directory."""
+        self.temp_dir.cleanup()
+
+    def _write_deltas(self, *records, tail: bytes = b""):
+        with open(self.deltas_file, "wb") as f:
+            for record in records:
+                f.write(json.dumps(record).encode("utf-8") + b"\n")
+            f.write(tail)
+
+    def test_records_appended_in_order(self):
+        """Test every record type is appended to its list and stats are updated."""
+        self._write_deltas(
+            {"participant": {"user_id": "11", "username": "bob"}},
+            {"participant_event": {"timestamp": "t", "user_id": "11", "username": "bob", "event_type": "join"}},
+            {"transcript": _entry("one")},
+            {"transcript": _entry("two")},
+        )
+
+        data = merge_session_deltas(_session_data(), self.session_file)
+
+        self.assertEqual([p["username"] for p in data["participants"]], ["alice", "bob"])
+        self.assertEqual(data["participant_events"][0]["event_type"], "join")
+        self.assertEqual([t["text"] for t in data["transcript"]], ["one", "two"])
+        self.assertEqual(data["stats"]["total_messages"], 2)
+        self.assertEqual(data["stats"]["unique_speakers"], 2)
+
+    def test_torn_last_line_skipped(self):
+        """Test a partially written last line (crash mid-flush) is skipped."""
+        self._write_deltas(
+            {"transcript": _entry("one")},
+            {"transcript": _entry("two")},
+            tail=b'{"transcript": {"timestamp": "2025-01-01T00:00:0',
+        )
+
+        data = merge_session_deltas(_session_data(), self.session_file)
+
+        self.assertEqual([t["text"] for t in data["transcript"]], ["one", "two"])
+
+    def test_no_delta_log(self):
+        """Test data is returned unchanged when there is no delta log."""
+        data = merge_session_deltas(_session_data(), self.session_file)
+        self.assertEqual(data["transcript"], [])
+
+    def test_ended_session_ignores_deltas(self):
+        """Test an ended (fully written) session doesn't replay a leftover log."""
+        self._write_deltas({"transcript": _entry("stale")})
+
+        data = merge_session_deltas(
+            _session_data(end_time="2025-01-01T00:10:00.000000"), self.session_file
+        )
+
+        self.assertEqual(data["transcript"], [])
+
+
+class TestTranscriptSessionPersistence(unittest.TestCase):
+    """Test flushing and ending sessions through TranscriptSessionManager."""
+
+    def setUp(self):
+        """Create a manager writing to a temporary transcripts directory."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        voice_cfg = SimpleNamespace(transcript_dir=self.temp_dir.name, transcript_flush_interval=30)
+        bot = SimpleNamespace(
+            config_manager=SimpleNamespace(for_guild=lambda *args: voice_cfg),
+            voice_clients=[],
+        )
+        self.manager = TranscriptSessionManager(bot)
+
+    def tearDown(self):
+        """Stop the writer thread and clean up temporary directory."""
+        if self.manager._io_executor is not None:
+            self.manager._io_executor.shutdown(wait=True)
+        self.temp_dir.cleanup()
+
+    def test_flush_then_resume_and_end(self):
+        """Test flushed deltas are loaded on resume and folded in on end."""
+        async def scenario():
+            manager = self.manager
+            session_id = manager.start_session("2", "1", "Guild", "General", "10", "alice")
+            manager.add_transcript("2", "10", "alice", "one")
+            session = manager.active_sessions["2"]
+            manager._flush_batch([session])
+
+            session_file = Path(session.file_path)
+            self.assertTrue(session_file.with_suffix(DELTAS_SUFFIX).exists())
+
+            # Simulate a restart: the session is resumed from .json + delta log
+            del manager.active_sessions["2"]
+            manager.resume_or_start_session("2", "1", "Guild", "General", "10", "alice", session_id)
+            self.assertEqual([t.text for t in manager.active_sessions["2"].transcript], ["one"])
+
+            manager.add_transcript("2", "10", "alice", "two")
+            manager.end_session("2")
+            manager._flush_task.cancel()
+            return session_file
+
+        session_file = asyncio.run(scenario())
+        # Let the final write queued on the writer thread finish
+        self.manager._io_executor.shutdown(wait=True)
+
+        data = json.loads(session_file.read_bytes())
+        self.assertIsNotNone(data["end_time"])
+        self.assertEqual([t["text"] for t in data["transcript"]], ["one", "two"])
+        self.assertFalse(session_file.with_suffix(DELTAS_SUFFIX).exists())
+
+
+if __name__ == "__main__":
+    unittest.main()
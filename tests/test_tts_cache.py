@@ -0,0 +1,166 @@
+"""
+Unit tests for the on-disk TTS audio cache.
+
+Tests:
+- make_cache_key stability (parameter order, Unicode normalization)
+- TTSDiskCache get/put and LRU order
+- TTSDiskCache byte budget eviction (sparing recently handed-out clips)
+- TTSDiskCache index persistence
+"""
+
+import hashlib
+import tempfile
+import unittest
+from pathlib import Path
+
+from bot.core.tts_engines.cache import INDEX_FILE, TTSDiskCache, make_cache_key
+
+
+class TestMakeCacheKey(unittest.TestCase):
+    """Test cache key construction."""
+
+    def test_key_is_stable(self):
+        """Test the key format doesn't change (it names files already on disk)."""
+        expected = hashlib.sha256("edge|rate=150|voice=en-US-AriaNeural|Hello".encode("utf-8")).hexdigest()
+        self.assertEqual(make_cache_key("edge", "Hello", voice="en-US-AriaNeural", rate=150), expected)
+
+    def test_param_order_ignored(self):
+        """Test keyword order doesn't affect the key."""
+        self.assertEqual(
+            make_cache_key("edge", "Hi", voice="a", rate=1.0, volume=0.5),
+            make_cache_key("edge", "Hi", volume=0.5, rate=1.0, voice="a"),
+        )
+
+    def test_text_normalized(self):
+        """Test composed and decomposed forms of the same text share a key."""
+        self.assertEqual(
+            make_cache_key("edge", "caf\u00e9", voice="a"),
+            make_cache_key("edge", "cafe\u0301", voice="a"),
+        )
+
+    def test_inputs_distinguish_keys(self):
+        """Test engine, text and parameters all change the key."""
+        base = make_cache_key("edge", "Hi", voice="a")
+        self.assertNotEqual(base, make_cache_key("piper", "Hi", voice="a"))
+        self.assertNotEqual(base, make_cache_key("edge", "Hi!", voice="a"))
+        self.assertNotEqual(base, make_cache_key("edge", "Hi", voice="b"))
+
+
+class TestTTSDiskCache(unittest.TestCase):
+    """Test TTSDiskCache storage, eviction and persistence."""
+
+    def setUp(self):
+        """Create temporary cache and source directories."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.root = Path(self.temp_dir.name) / "cache"
+        self.source_dir = Path(self.temp_dir.name) / "tmp"
+        self.source_dir.mkdir()
+
+    def tearDown(self):
+        """Clean up temporary directories."""
+        self.temp_dir.cleanup()
+
+    def _source(self, name: str, size: int) -> str:
+        """Write a synthesized-audio stand-in of the given size."""
+        path = self.source_dir / name
+        path.write_bytes(b"\0" * size)
+        return str(path)
+
+    def _key(self, text: str) -> str:
+        return make_cache_key("test", text)
+
+    def test_put_and_get(self):
+        """Test a stored clip is moved into the cache and found again."""
+        cache = TTSDiskCache(self.root, max_bytes=1000)
+        source = self._source("a.wav", 10)
+
+        cached_path = cache.put(self._key("a"), source)
+
+        self.assertFalse(Path(source).exists())
+        self.assertTrue(Path(cached_path).is_relative_to(self.root))
+        self.assertEqual(cache.get(self._key("a")), cached_path)
+        self.assertIsNone(cache.get(self._key("missing")))
+
+    def test_budget_evicts_least_recently_used(self):
+        """Test going over budget evicts the least recently used clip first."""
+        cache = TTSDiskCache(self.root, max_bytes=250, evict_grace=0)
+        path_a = cache.put(self._key("a"), self._source("a.wav", 100))
+        cache.put(self._key("b"), self._source("b.wav", 100))
+
+        # Touch "a" so "b" becomes least recently used
+        self.assertIsNotNone(cache.get(self._key("a")))
+        cache.put(self._key("c"), self._source("c.wav", 100))
+
+        self.assertEqual(cache.get(self._key("a")), path_a)
+        self.assertIsNone(cache.get(self._key("b")))
+        self.assertIsNotNone(cache.get(self._key("c")))
+        self.assertEqual(cache._total_bytes, 200)
+
+    def test_oversized_entry_kept(self):
+        """Test the newest clip is kept even if it alone exceeds the budget."""
+        cache = TTSDiskCache(self.root, max_bytes=50, evict_grace=0)
+        cache.put(self._key("a"), self._source("a.wav", 40))
+        path_b = cache.put(self._key("b"), self._source("b.wav", 100))
+
+        self.assertIsNone(cache.get(self._key("a")))
+        self.assertEqual(cache.get(self._key("b")), path_b)
+
+    def test_recent_entries_not_evicted(self):
+        """Test clips handed out within the grace period survive going over budget."""
+        cache = TTSDiskCache(self.root, max_bytes=150, evict_grace=60)
+        path_a = cache.put(self._key("a"), self._source("a.wav", 100))
+        path_b = cache.put(self._key("b"), self._source("b.wav", 100))
+
+        self.assertTrue(Path(path_a).exists())
+        self.assertEqual(cache.get(self._key("a")), path_a)
+        self.assertEqual(cache.get(self._key("b")), path_b)
+        self.assertEqual(cache._total_bytes, 200)
+
+    def test_entries_from_index_evictable(self):
+        """Test entries loaded from the index (not used this run) are evicted normally."""
+        TTSDiskCache(self.root, max_bytes=1000).put(self._key("a"), self._source("a.wav", 100))
+
+        cache = TTSDiskCache(self.root, max_bytes=150, evict_grace=60)
+        path_b = cache.put(self._key("b"), self._source("b.wav", 100))
+
+        self.assertIsNone(cache.get(self._key("a")))
+        self.assertEqual(cache.get(self._key("b")), path_b)
+
+    def test_index_persisted(self):
+        """Test a new cache instance picks up entries and LRU order from the index."""
+        cache = TTSDiskCache(self.root, max_bytes=250, evict_grace=0)
+        cache.put(self._key("a"), self._source("a.wav", 100))
+        path_b = cache.put(self._key("b"), self._source("b.wav", 100))
+        self.assertTrue((self.root / INDEX_FILE).exists())
+
+        reloaded = TTSDiskCache(self.root, max_bytes=250, evict_grace=0)
+        self.assertEqual(reloaded.get(self._key("b")), path_b)
+        self.assertEqual(reloaded._total_bytes, 200)
+
+        # "a" is still least recently used after the reload
+        reloaded.put(self._key("c"), self._source("c.wav", 100))
+        self.assertIsNone(reloaded.get(self._key("a")))
+        self.assertEqual(reloaded.get(self._key("b")), path_b)
+
+    def test_missing_file_forgotten(self):
+        """Test an entry whose file was deleted is dropped on lookup."""
+        cache = TTSDiskCache(self.root, max_bytes=1000)
+        path = cache.put(self._key("a"), self._source("a.wav", 10))
+        Path(path).unlink()
+
+        self.assertIsNone(cache.get(self._key("a")))
+        self.assertEqual(cache._total_bytes, 0)
+
+    def test_corrupt_index_starts_empty(self):
+        """Test an unreadable index is ignored rather than raising."""
+        self.root.mkdir(parents=True)
+        (self.root / INDEX_FILE).write_text("{not json")
+
+        cache = TTSDiskCache(self.root, max_bytes=1000)
+        self.assertIsNone(cache.get(self._key("a")))
+        cache.put(self._key("a"), self._source("a.wav", 10))
+        self.assertIsNotNone(TTSDiskCache(self.root).get(self._key("a")))
+
+
+if __name__ == "__main__":
+    unittest.main()
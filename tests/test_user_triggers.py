@@ -0,0 +1,142 @@
+"""
+Unit tests for user trigger statistics persistence.
+
+Tests:
+- LazyUserMap lazy parsing and corrupt entry handling
+- _stream_dump output and save/load round trip
+"""
+
+import io
+import json
+import os
+import tempfile
+import unittest
+
+from bot.core.stats.user_triggers import (
+    GuildUserStats,
+    LazyUserMap,
+    UserStats,
+    UserStatsData,
+    UserTriggerStats,
+    _stream_dump,
+    increment_user_trigger_stat,
+    load_user_stats,
+    save_user_stats,
+)
+
+
+def _raw_user(user_id: str, total: int = 1) -> dict:
+    """Raw JSON entry for a user, as stored in the stats file."""
+    return {
+        "user_id": user_id,
+        "username": f"user{user_id}",
+        "trigger_stats": {
+            "week": total,
+            "month": total,
+            "total": total,
+            "channel_stats": {"100": total},
+            "trigger_words": {"hello": total},
+            "last_triggered": None,
+        },
+    }
+
+
+class TestLazyUserMap(unittest.TestCase):
+    """Test LazyUserMap parsing on access."""
+
+    def setUp(self):
+        """Map with two valid users and one malformed entry."""
+        self.users = LazyUserMap(
+            {
+                "1": _raw_user("1", 3),
+                "2": _raw_user("2", 5),
+                "bad": {"user_id": "bad", "unexpected_field": True},
+            },
+            guild_id="42",
+        )
+
+    def test_parses_on_access(self):
+        """Test entries become UserStats only when read."""
+        self.assertIsInstance(self.users._entries["1"], dict)
+
+        user_stat = self.users["1"]
+        self.assertIsInstance(user_stat, UserStats)
+        self.assertIsInstance(user_stat.trigger_stats, UserTriggerStats)
+        self.assertEqual(user_stat.trigger_stats.total, 3)
+        self.assertIs(self.users._entries["1"], user_stat)
+
+    def test_contains_then_getitem(self):
+        """Test `uid in users` is only true when users[uid] succeeds."""
+        for user_id in ("1", "2", "bad", "missing"):
+            if user_id in self.users:
+                self.assertIsInstance(self.users[user_id], UserStats)
+
+        self.assertIn("1", self.users)
+        self.assertNotIn("bad", self.users)
+        self.assertNotIn("missing", self.users)
+
+    def test_malformed_entry_dropped(self):
+        """Test a malformed entry is removed and raises KeyError."""
+        with self.assertRaises(KeyError):
+            self.users["bad"]
+
+        self.assertEqual(len(self.users), 2)
+        self.assertIsNone(self.users.get("bad"))
+
+    def test_items_skip_malformed(self):
+        """Test iteration yields only valid users."""
+        totals = {user_id: user_stat.trigger_stats.total for user_id, user_stat in self.users.items()}
+        self.assertEqual(totals, {"1": 3, "2": 5})
+
+
+class TestStreamDump(unittest.TestCase):
+    """Test streaming user stats to disk."""
+
+    def _dump(self, user_stats) -> dict:
+        buffer = io.BytesIO()
+        _stream_dump(user_stats, buffer)
+        return json.loads(buffer.getvalue())
+
+    def test_empty(self):
+        """Test empty stats and guilds without users produce valid JSON."""
+        self.assertEqual(self._dump(UserStatsData()), {"guilds": {}})
+        self.assertEqual(
+            self._dump(UserStatsData(guilds={"1": GuildUserStats(users=LazyUserMap())})),
+            {"guilds": {"1": {"users": {}}}},
+        )
+
+    def test_raw_and_parsed_entries(self):
+        """Test unparsed entries are written verbatim next to parsed ones."""
+        users = LazyUserMap({"1": _raw_user("1", 3), "2": _raw_user("2", 5)}, guild_id="42")
+        users["2"].trigger_stats.total += 1  # Parse and modify one user
+        users["3"] = UserStats(user_id="3", username="new")
+        data = UserStatsData(guilds={"42": GuildUserStats(users=users), "43": GuildUserStats(users={})})
+
+        dumped = self._dump(data)
+
+        self.assertEqual(dumped["guilds"]["42"]["users"]["1"], _raw_user("1", 3))
+        self.assertEqual(dumped["guilds"]["42"]["users"]["2"]["trigger_stats"]["total"], 6)
+        self.assertEqual(dumped["guilds"]["42"]["users"]["3"]["trigger_stats"]["total"], 0)
+        self.assertEqual(dumped["guilds"]["43"], {"users": {}})
+
+    def test_save_load_round_trip(self):
+        """Test saved stats load back with the same counts and no temp files left."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            file_path = os.path.join(temp_dir, "user_stats.json")
+            user_stats = UserStatsData()
+            for trigger_word in ("hello", "hello", "bye"):
+                increment_user_trigger_stat(user_stats, "1", "alice", "42", "100", trigger_word)
+
+            save_user_stats(file_path, user_stats)
+            save_user_stats(file_path, load_user_stats(file_path))  # Re-save unparsed entries
+            loaded = load_user_stats(file_path)
+
+            trigger_stats = loaded.guilds["42"].users["1"].trigger_stats
+            self.assertEqual(trigger_stats.total, 3)
+            self.assertEqual(trigger_stats.trigger_words, {"hello": 2, "bye": 1})
+            self.assertEqual(trigger_stats.channel_stats, {"100": 3})
+            self.assertEqual(sorted(os.listdir(temp_dir)), ["user_stats.json", "user_stats.json.backup"])
+
+
+if __name__ == "__main__":
+    unittest.main()
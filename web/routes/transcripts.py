@@ -410,6 +410,10 @@ async def get_historical_session(session_id: str):
                 with open(session_file, 'r', encoding='utf-8') as f:
                     session_data = json.load(f)
 
+                # Active sessions keep recent entries in a delta log beside the file
+                from bot.core.transcript_session import merge_session_deltas
+                session_data = merge_session_deltas(session_data, session_file)
+
                 return {
                     "session": session_data,
                     "success": True